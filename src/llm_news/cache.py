@@ -0,0 +1,169 @@
+"""Disk cache for collector results.
+
+按 TTL 缓存 collector 抓取结果，避免每次运行都重复请求上游 API。
+Each entry is a JSON file under data/cache/<namespace>/<sha1(key)>.json;
+freshness is judged by file mtime.
+
+另支持 HTTP 条件请求：保存 ETag / Last-Modified 及对应结果，
+服务端返回 304 时直接复用结果，跳过下载和解析。
+load_json / save_json 则提供无 TTL 的通用 JSON 存储（如 LLM 摘要缓存）。
+
+CI（.github/workflows/daily.yml）通过 actions/cache 在运行之间保留 data/cache；
+按天有效的 TTL 缓存（arXiv / GitHub releases）的 key 含 UTC 日期，
+即使次日运行距上次不足 TTL 也不会命中前一天的结果；TTL 缓存仅服务于同日重跑，
+跨日复用依赖 ETag / Last-Modified 条件请求。
+"""
+
+import hashlib
+import json
+import logging
+import time
+from collections.abc import Mapping
+from pathlib import Path
+from typing import Any
+
+from .models import NewsItem
+
+logger = logging.getLogger(__name__)
+
+CACHE_DIR = Path("data/cache")
+
+
+def _cache_path(namespace: str, key: str) -> Path:
+    digest = hashlib.sha1(key.encode("utf-8")).hexdigest()
+    return CACHE_DIR / namespace / f"{digest}.json"
+
+
+def load_items(namespace: str, key: str, ttl: float) -> list[NewsItem] | None:
+    """Load cached items if the entry exists and is younger than ttl seconds.
+
+    缓存未命中或已过期时返回 None。
+    """
+    path = _cache_path(namespace, key)
+    try:
+        if time.time() - path.stat().st_mtime > ttl:
+            return None
+        data = json.loads(path.read_text(encoding="utf-8"))
+        return [NewsItem(**d) for d in data]
+    except FileNotFoundError:
+        return None
+    except Exception:
+        logger.warning("Failed to read cache %s, ignoring", path)
+        return None
+
+
+def save_items(namespace: str, key: str, items: list[NewsItem]) -> None:
+    """Persist items to the cache (best effort, errors are logged)."""
+    path = _cache_path(namespace, key)
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        data = [item.model_dump(mode="json") for item in items]
+        path.write_text(json.dumps(data, ensure_ascii=False), encoding="utf-8")
+    except Exception:
+        logger.warning("Failed to write cache %s", path)
+
+
+def cache_age(namespace: str, key: str) -> float | None:
+    """Seconds since the entry was last written or refreshed (None if absent)."""
+    try:
+        return time.time() - _cache_path(namespace, key).stat().st_mtime
+    except OSError:
+        return None
+
+
+def touch(namespace: str, key: str) -> None:
+    """Mark an entry as just revalidated (e.g. after a 304), resetting its age."""
+    try:
+        _cache_path(namespace, key).touch()
+    except OSError:
+        pass
+
+
+def load_json(namespace: str, key: str) -> Any:
+    """Load a JSON payload stored with save_json (no TTL; None if absent or unreadable)."""
+    path = _cache_path(namespace, key)
+    try:
+        return json.loads(path.read_text(encoding="utf-8"))
+    except FileNotFoundError:
+        return None
+    except Exception:
+        logger.warning("Failed to read cache %s, ignoring", path)
+        return None
+
+
+def save_json(namespace: str, key: str, payload: Any) -> None:
+    """Persist a JSON-serializable payload (best effort, errors are logged)."""
+    path = _cache_path(namespace, key)
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(json.dumps(payload, ensure_ascii=False), encoding="utf-8")
+    except Exception:
+        logger.warning("Failed to write cache %s", path)
+
+
+def load_validated_json(namespace: str, key: str) -> tuple[dict[str, str], Any] | None:
+    """Load conditional-request headers and the JSON payload cached alongside them.
+
+    返回 (If-None-Match / If-Modified-Since 请求头, 上次保存的 payload)；无记录时返回 None。
+    """
+    data = load_json(namespace, key)
+    if not isinstance(data, dict):
+        return None
+
+    headers: dict[str, str] = {}
+    if data.get("etag"):
+        headers["If-None-Match"] = data["etag"]
+    if data.get("last_modified"):
+        headers["If-Modified-Since"] = data["last_modified"]
+    if not headers:
+        return None
+    return headers, data.get("payload")
+
+
+def save_validated_json(
+    namespace: str,
+    key: str,
+    response_headers: Mapping[str, str],
+    payload: Any,
+) -> None:
+    """Store the response validators with a JSON-serializable payload.
+
+    响应不带 ETag / Last-Modified 时不保存（无法发起条件请求）。
+    """
+    etag = response_headers.get("etag", "")
+    last_modified = response_headers.get("last-modified", "")
+    if not etag and not last_modified:
+        return
+
+    save_json(
+        namespace, key,
+        {"etag": etag, "last_modified": last_modified, "payload": payload},
+    )
+
+
+def load_validated(
+    namespace: str, key: str,
+) -> tuple[dict[str, str], list[NewsItem]] | None:
+    """Load conditional-request headers and the items cached alongside them."""
+    cached = load_validated_json(namespace, key)
+    if cached is None:
+        return None
+    headers, payload = cached
+    try:
+        return headers, [NewsItem(**d) for d in payload or []]
+    except Exception:
+        logger.warning("Invalid cached items for %s/%s, ignoring", namespace, key)
+        return None
+
+
+def save_validated(
+    namespace: str,
+    key: str,
+    response_headers: Mapping[str, str],
+    items: list[NewsItem],
+) -> None:
+    """Store the response validators with the items derived from that response."""
+    save_validated_json(
+        namespace, key, response_headers,
+        [item.model_dump(mode="json") for item in items],
+    )
@@ -2,37 +2,57 @@
 
 Collector registry — maps collector names to their classes.
 新增 collector 只需：1) 写 collector 文件  2) 在此注册  3) 在 config.yaml 启用。
+
+Collector 模块按需导入（首次访问时才 import），未启用的 collector
+不会拖入 arxiv / praw 等依赖，缩短启动时间。
 """
 
-from .arxiv_collector import ArxivCollector
+import importlib
+from typing import Any
+
 from .base import BaseCollector
-from .blog_collector import BlogCollector
-from .github_collector import GithubCollector
-from .github_trending_collector import GithubTrendingCollector
-from .hackernews_collector import HackerNewsCollector
-from .hf_models_collector import HfModelsCollector
-from .hf_papers_collector import HfPapersCollector
-from .pwc_collector import PwcCollector
-from .reddit_collector import RedditCollector
-
-# Collector registry: name -> class
-# collector 注册表：名称 -> 类
-REGISTRY: dict[str, type[BaseCollector]] = {
-    "arxiv": ArxivCollector,
-    "blog": BlogCollector,
-    "github": GithubCollector,
-    "github_trending": GithubTrendingCollector,
-    "hackernews": HackerNewsCollector,
-    "hf_models": HfModelsCollector,
-    "hf_papers": HfPapersCollector,
-    "pwc": PwcCollector,
-    "reddit": RedditCollector,
+
+# Lazy collector registry: name -> (module, class name)
+# collector 注册表：名称 -> (模块, 类名)，首次访问时导入
+_LAZY: dict[str, tuple[str, str]] = {
+    "arxiv": (".arxiv_collector", "ArxivCollector"),
+    "blog": (".blog_collector", "BlogCollector"),
+    "github": (".github_collector", "GithubCollector"),
+    "github_trending": (".github_trending_collector", "GithubTrendingCollector"),
+    "hackernews": (".hackernews_collector", "HackerNewsCollector"),
+    "hf_models": (".hf_models_collector", "HfModelsCollector"),
+    "hf_papers": (".hf_papers_collector", "HfPapersCollector"),
+    "pwc": (".pwc_collector", "PwcCollector"),
+    "reddit": (".reddit_collector", "RedditCollector"),
 }
 
+_CLASS_TO_NAME: dict[str, str] = {cls: name for name, (_, cls) in _LAZY.items()}
+
+
+def get_collector(name: str) -> type[BaseCollector]:
+    """Import and return the collector class registered under name.
+
+    Raises:
+        KeyError: If no collector is registered under name.
+    """
+    module, cls = _LAZY[name]
+    return getattr(importlib.import_module(module, __name__), cls)
+
+
+def __getattr__(attr: str) -> Any:
+    # PEP 562: keep `REGISTRY` and `from .collectors import XxxCollector` working.
+    # 兼容旧用法：访问 REGISTRY 或具体类名时才导入对应模块
+    if attr == "REGISTRY":
+        return {name: get_collector(name) for name in _LAZY}
+    if attr in _CLASS_TO_NAME:
+        return get_collector(_CLASS_TO_NAME[attr])
+    raise AttributeError(f"module {__name__!r} has no attribute {attr!r}")
+
+
 __all__ = [
-    "BaseCollector",
     "REGISTRY",
     "ArxivCollector",
+    "BaseCollector",
     "BlogCollector",
     "GithubCollector",
     "GithubTrendingCollector",
@@ -41,4 +61,5 @@ __all__ = [
     "HfPapersCollector",
     "PwcCollector",
     "RedditCollector",
+    "get_collector",
 ]
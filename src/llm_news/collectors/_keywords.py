@@ -0,0 +1,23 @@
+"""Shared keyword matching for collectors.
+
+各 collector 共用的关键词过滤：关键词合并为单个正则，每条文本只扫描一次。
+"""
+
+import functools
+import re
+
+
+@functools.lru_cache(maxsize=32)
+def compile_keywords(keywords: tuple[str, ...]) -> re.Pattern[str] | None:
+    """Compile keywords into one lowercase alternation for single-pass matching.
+
+    无关键词时返回 None（不过滤）。
+    """
+    if not keywords:
+        return None
+    return re.compile("|".join(re.escape(kw.lower()) for kw in keywords))
+
+
+def matches_keywords(text: str, pattern: re.Pattern[str]) -> bool:
+    """Check if text contains any of the keywords (case-insensitive)."""
+    return pattern.search(text.lower()) is not None
@@ -4,21 +4,55 @@ Fetches recent papers from cs.CL, cs.AI, cs.LG and filters by LLM keywords.
 Only keeps papers affiliated with well-known institutions (configurable).
 arXiv API 免费无限制（建议 3s 间隔）。
 仅保留知名大学/公司的论文（可配置机构白名单）。
+
+直接请求 export.arxiv.org 并流式解析 Atom/OAI XML，逐条产出结果，不构建整页 DOM。
+可选 OAI-PMH 增量收割路径（use_oai），按 resumptionToken 翻页。
 """
 
+import functools
 import logging
 import re
-from datetime import datetime, timezone
+import time
+import xml.etree.ElementTree as ET
+from collections.abc import Iterator
+from datetime import datetime, timedelta, timezone
 
 import arxiv
+import httpx
 
+from ..cache import load_items, save_items
 from ..models import NewsItem
+from ._keywords import compile_keywords, matches_keywords
+from ._time import utc_today
 from .base import BaseCollector
 
 logger = logging.getLogger(__name__)
 
+# arXiv 每日更新一次，结果按 UTC 日期缓存（key 含日期，TTL 仅作上限）
+# arXiv updates daily: cache per UTC day (the date is part of the key)
+_CACHE_TTL = 24 * 3600
+
+# ── Endpoints / 接口 ────────────────────────────────────────────────────
+# export.arxiv.org 是 arXiv 为程序化访问指定的镜像，负载更低、更少限流
+ARXIV_API_URL = "https://export.arxiv.org/api/query"
+OAI_PMH_URL = "https://export.arxiv.org/oai2"
+_ATOM_NS = "{http://www.w3.org/2005/Atom}"
+_ARXIV_ATOM_NS = "{http://arxiv.org/schemas/atom}"
+_OAI_NS = "{http://www.openarchives.org/OAI/2.0/}"
+_ARXIV_NS = "{http://arxiv.org/OAI/arXiv/}"
+
+_HTTP_HEADERS = {"User-Agent": "llm-news/0.1 (+https://github.com/llm-news)"}
+# arXiv 建议相邻请求间隔 3s / arXiv asks for 3s between consecutive requests
+_API_DELAY_SECONDS = 3.0
+# 单页 1000 条：页数少、单页响应又不至于过大；API 单次上限 2000
+# Records per page, and the hard cap on results per query
+_API_PAGE_SIZE = 1000
+_API_MAX_RESULTS = 2000
+# 5xx / 限流时的最大重试次数（优先遵循 Retry-After）
+_MAX_RETRIES = 3
+
 # ── Known institutions whitelist / 知名机构白名单 ──────────────────────────
-DEFAULT_KNOWN_INSTITUTIONS: list[str] = [
+DEFAULT_KNOWN_INSTITUTIONS: tuple[str, ...] = (
     # --- Companies / 公司 ---
     "openai", "anthropic", "google deepmind", "google research", "google brain",
     "meta ai", "meta platforms", "meta research", "facebook ai research",
@@ -53,27 +87,48 @@ DEFAULT_KNOWN_INSTITUTIONS: list[str] = [
     "allen institute", "allen institute for ai", "ai2",
     "eleutherai", "eleuther ai", "laion", "inria",
     "max planck", "max planck institute",
-]
+)
+
+
+_WORD_RE = re.compile(r"\w+")
+
+# (单词机构名集合, 其余机构名的正则) / (single-word names, regex for the rest)
+AffiliationMatcher = tuple[frozenset[str], re.Pattern[str] | None]
 
 
-def _build_affiliation_pattern(institutions: list[str]) -> re.Pattern[str]:
-    """Build a compiled regex pattern for matching institutions.
+@functools.lru_cache(maxsize=8)
+def _build_affiliation_matcher(institutions: tuple[str, ...]) -> AffiliationMatcher:
+    """Build a matcher for institution names.
 
-    构建机构名称正则（word-boundary 匹配，避免子串误判）。
+    构建机构匹配器（word-boundary 语义，避免子串误判）：
+    - 单个单词的机构名（openai、tsinghua…）放入 frozenset，与文本分词结果求交集；
+    - 多词或含标点的机构名（google deepmind、x.ai…）编译为一个正则兜底。
+    两侧统一 casefold，正则无需 IGNORECASE（逐字符大小写折叠比一次 casefold 更贵）。
+    按机构元组缓存，相同白名单的多个实例共享同一结果。
     """
-    sorted_inst = sorted(institutions, key=len, reverse=True)
-    escaped = [re.escape(name) for name in sorted_inst]
-    pattern = "|".join(rf"\b{e}\b" for e in escaped)
-    return re.compile(pattern, re.IGNORECASE)
+    single = frozenset(
+        name.casefold() for name in institutions if _WORD_RE.fullmatch(name)
+    )
+    multi = sorted(
+        (name.casefold() for name in institutions if not _WORD_RE.fullmatch(name)),
+        key=len, reverse=True,
+    )
+    if not multi:
+        return single, None
+    # 边界断言提到分组外，所有机构名共用一次边界检查，而非每个分支各做一次
+    alternation = "|".join(re.escape(name) for name in multi)
+    return single, re.compile(rf"\b(?:{alternation})\b")
 
 
 def _matches_institution(
     result: arxiv.Result,
-    pattern: re.Pattern[str],
+    matcher: AffiliationMatcher,
 ) -> bool:
     """Check if paper is from a known institution.
 
     判断论文是否来自知名机构：扫描作者名、摘要和 comment 字段。
+    文本按单词切分后与单词机构名求交集，语义等同于单词边界正则匹配；
+    命中即返回，未命中时只需运行分支少得多的多词正则。
     """
     parts: list[str] = []
     parts.append(" ".join(a.name for a in result.authors))
@@ -82,8 +137,214 @@ def _matches_institution(
         parts.append(result.comment)
     if result.journal_ref:
         parts.append(result.journal_ref)
-    text_to_scan = " ".join(parts)
-    return bool(pattern.search(text_to_scan))
+    text_to_scan = " ".join(parts).casefold()
+
+    single, pattern = matcher
+    if not single.isdisjoint(_WORD_RE.findall(text_to_scan)):
+        return True
+    return pattern is not None and pattern.search(text_to_scan) is not None
+
+
+def _oai_record_to_result(record: ET.Element) -> arxiv.Result | None:
+    """Convert an OAI-PMH arXiv-format record to an arxiv.Result.
+
+    将 OAI 记录映射为 arxiv.Result，复用 API 路径的机构过滤和 NewsItem 映射。
+    """
+    meta = record.find(f"{_OAI_NS}metadata/{_ARXIV_NS}arXiv")
+    if meta is None:  # deleted record / 已删除记录
+        return None
+
+    def text(tag: str) -> str:
+        return (meta.findtext(f"{_ARXIV_NS}{tag}") or "").strip()
+
+    paper_id = text("id")
+    if not paper_id:
+        return None
+
+    authors = []
+    for author in meta.iterfind(f"{_ARXIV_NS}authors/{_ARXIV_NS}author"):
+        forenames = (author.findtext(f"{_ARXIV_NS}forenames") or "").strip()
+        keyname = (author.findtext(f"{_ARXIV_NS}keyname") or "").strip()
+        authors.append(arxiv.Result.Author(f"{forenames} {keyname}".strip()))
+
+    created = text("created")
+    published = (
+        datetime.strptime(created, "%Y-%m-%d").replace(tzinfo=timezone.utc)
+        if created
+        else None
+    )
+    categories = text("categories").split()
+
+    return arxiv.Result(
+        entry_id=f"http://arxiv.org/abs/{paper_id}",
+        published=published,
+        title=text("title"),
+        authors=authors,
+        summary=text("abstract"),
+        comment=text("comments"),
+        journal_ref=text("journal-ref"),
+        doi=text("doi"),
+        primary_category=categories[0] if categories else "",
+        categories=categories,
+    )
+
+
+def _result_to_item(result: arxiv.Result) -> NewsItem:
+    """Convert an arxiv.Result to a NewsItem.
+
+    " ".join(s.split()) 一次完成去首尾空白 + 换行/连续空白归一。
+    """
+    authors = result.authors
+    authors_str = ", ".join([a.name for a in authors[:3]])
+    if len(authors) > 3:
+        authors_str += " et al."
+
+    categories = result.categories
+    source_name = (
+        ", ".join([c.rpartition(".")[2] for c in categories]) if categories else ""
+    )
+    published = result.published
+
+    return NewsItem(
+        title=" ".join(result.title.split()),
+        url=result.entry_id,
+        source="arxiv",
+        source_name=source_name,
+        content=f"[Authors: {authors_str}] " + " ".join(result.summary.split()),
+        published_at=published.replace(tzinfo=timezone.utc) if published else None,
+    )
+
+
+def _stream_elements(
+    client: httpx.Client,
+    url: str,
+    params: dict[str, str | int],
+    tags: frozenset[str],
+) -> Iterator[ET.Element]:
+    """GET an XML document and yield elements with the given tags as they complete.
+
+    增量解析响应流，元素 yield 后立即 clear，峰值内存与单条记录同量级。
+    5xx / 429 在读取响应体之前重试，不会重复产出元素。
+    """
+    for attempt in range(_MAX_RETRIES + 1):
+        with client.stream("GET", url, params=params) as resp:
+            if resp.status_code in (429, 500, 502, 503) and attempt < _MAX_RETRIES:
+                try:
+                    retry_after = int(resp.headers.get("Retry-After", "10"))
+                except ValueError:
+                    retry_after = 10
+                logger.info(
+                    "arXiv returned %d, retrying in %ds", resp.status_code, retry_after,
+                )
+                time.sleep(min(retry_after, 60))
+                continue
+            resp.raise_for_status()
+
+            parser = ET.XMLPullParser(events=("end",))
+            for chunk in resp.iter_bytes():
+                parser.feed(chunk)
+                for _, elem in parser.read_events():
+                    if elem.tag in tags:
+                        yield elem
+                        elem.clear()
+            parser.close()
+        return
+
+
+def _atom_entry_to_result(entry: ET.Element) -> arxiv.Result | None:
+    """Convert an arXiv API Atom <entry> to an arxiv.Result.
+
+    API 出错时返回一条 id 指向 /api/errors 的 entry，跳过。
+    """
+    def text(tag: str) -> str:
+        return (entry.findtext(tag) or "").strip()
+
+    entry_id = text(f"{_ATOM_NS}id")
+    if not entry_id or "/api/errors" in entry_id:
+        return None
+
+    published = text(f"{_ATOM_NS}published")
+    updated = text(f"{_ATOM_NS}updated")
+    primary = entry.find(f"{_ARXIV_ATOM_NS}primary_category")
+
+    return arxiv.Result(
+        entry_id=entry_id,
+        updated=datetime.fromisoformat(updated) if updated else None,
+        published=datetime.fromisoformat(published) if published else None,
+        title=text(f"{_ATOM_NS}title"),
+        authors=[
+            arxiv.Result.Author((a.findtext(f"{_ATOM_NS}name") or "").strip())
+            for a in entry.iterfind(f"{_ATOM_NS}author")
+        ],
+        summary=text(f"{_ATOM_NS}summary"),
+        comment=text(f"{_ARXIV_ATOM_NS}comment"),
+        journal_ref=text(f"{_ARXIV_ATOM_NS}journal_ref"),
+        doi=text(f"{_ARXIV_ATOM_NS}doi"),
+        primary_category=primary.get("term", "") if primary is not None else "",
+        categories=[
+            c.get("term", "") for c in entry.iterfind(f"{_ATOM_NS}category")
+        ],
+    )
+
+
+def _iter_api_results(
+    client: httpx.Client,
+    query: str,
+    max_results: int,
+    page_size: int,
+) -> Iterator[arxiv.Result]:
+    """Page through the arXiv search API, newest submissions first.
+
+    替代 arxiv.Client.results()：同样按页请求、页间等待 3s，但流式解析每页。
+    """
+    start = 0
+    while start < max_results:
+        if start:
+            time.sleep(_API_DELAY_SECONDS)
+        requested = min(page_size, max_results - start)
+        params: dict[str, str | int] = {
+            "search_query": query,
+            "start": start,
+            "max_results": requested,
+            "sortBy": "submittedDate",
+            "sortOrder": "descending",
+        }
+        received = 0
+        for entry in _stream_elements(
+            client, ARXIV_API_URL, params, frozenset({f"{_ATOM_NS}entry"}),
+        ):
+            received += 1
+            result = _atom_entry_to_result(entry)
+            if result is not None:
+                yield result
+        if received < requested:
+            return
+        start += received
+
+
+def _iter_oai_records(client: httpx.Client, from_date: str) -> Iterator[ET.Element]:
+    """Harvest cs records via OAI-PMH ListRecords, following resumptionToken.
+
+    流式解析每页响应，逐条 yield <record>。
+    """
+    params: dict[str, str | int] = {
+        "verb": "ListRecords",
+        "from": from_date,
+        "metadataPrefix": "arXiv",
+        "set": "cs",
+    }
+    tags = frozenset({f"{_OAI_NS}record", f"{_OAI_NS}resumptionToken"})
+    while True:
+        token = ""
+        for elem in _stream_elements(client, OAI_PMH_URL, params, tags):
+            if elem.tag == f"{_OAI_NS}record":
+                yield elem
+            else:
+                token = (elem.text or "").strip()
+
+        if not token:
+            return
+        params = {"verb": "ListRecords", "resumptionToken": token}
 
 
 class ArxivCollector(BaseCollector):
@@ -100,15 +361,55 @@ class ArxivCollector(BaseCollector):
         max_results: int = 50,
         require_institution: bool = True,
         known_institutions: list[str] | None = None,
+        use_oai: bool = False,
     ) -> None:
         self.categories = categories or ["cs.CL", "cs.AI", "cs.LG"]
+        if max_results > _API_MAX_RESULTS and not use_oai:
+            logger.warning(
+                "arXiv max_results=%d exceeds API limit, capping to %d "
+                "(use_oai for bulk harvesting)",
+                max_results, _API_MAX_RESULTS,
+            )
+            max_results = _API_MAX_RESULTS
         self.max_results = max_results
         self.require_institution = require_institution
-        self.known_institutions = known_institutions or DEFAULT_KNOWN_INSTITUTIONS
+        self.known_institutions = (
+            tuple(known_institutions) if known_institutions else DEFAULT_KNOWN_INSTITUTIONS
+        )
+        self.use_oai = use_oai
+        self._inst_matcher = _build_affiliation_matcher(self.known_institutions)
+
+    def _harvest_oai(
+        self, client: httpx.Client, keywords: list[str],
+    ) -> list[arxiv.Result]:
+        """Harvest yesterday's records via OAI-PMH, filtered in-process.
+
+        按分类和关键词本地过滤，再按提交时间倒序截取 max_results 条，
+        与 API 路径（SubmittedDate 倒序）保持一致。
+        """
+        from_date = (datetime.now(timezone.utc) - timedelta(days=1)).strftime("%Y-%m-%d")
+        categories = set(self.categories)
+        kw_pattern = compile_keywords(tuple(keywords))
+
+        results: list[arxiv.Result] = []
+        for record in _iter_oai_records(client, from_date):
+            result = _oai_record_to_result(record)
+            if result is None or not categories.intersection(result.categories):
+                continue
+            if kw_pattern and not matches_keywords(
+                f"{result.title} {result.summary}", kw_pattern,
+            ):
+                continue
+            results.append(result)
+
+        results.sort(
+            key=lambda r: r.published or datetime.min.replace(tzinfo=timezone.utc),
+            reverse=True,
+        )
+        return results[: self.max_results]
 
     def collect(self, keywords: list[str]) -> list[NewsItem]:
         items: list[NewsItem] = []
-        inst_pattern = _build_affiliation_pattern(self.known_institutions)
 
         cat_query = " OR ".join(f"cat:{cat}" for cat in self.categories)
         kw_query = " OR ".join(f'"{kw}"' for kw in keywords[:15])
@@ -116,46 +417,41 @@ class ArxivCollector(BaseCollector):
 
         logger.info("arXiv query: %s (max_results=%d)", query[:120], self.max_results)
 
-        client = arxiv.Client(page_size=self.max_results, delay_seconds=3.0)
-        search = arxiv.Search(
-            query=query,
-            max_results=self.max_results,
-            sort_by=arxiv.SortCriterion.SubmittedDate,
-            sort_order=arxiv.SortOrder.Descending,
+        cache_key = (
+            f"{query}|{self.max_results}|submitted_desc"
+            f"|{self.require_institution}|{','.join(self.known_institutions)}"
+            f"|oai={self.use_oai}|{utc_today()}"
         )
+        cached = load_items("arxiv", cache_key, _CACHE_TTL)
+        if cached is not None:
+            logger.info("arXiv: cache hit, reusing %d papers", len(cached))
+            return cached
 
         total_fetched = 0
         skipped_institution = 0
 
         try:
-            for result in client.results(search):
-                total_fetched += 1
-                if self.require_institution and not _matches_institution(result, inst_pattern):
-                    skipped_institution += 1
-                    continue
-
-                authors_str = ", ".join(a.name for a in result.authors[:3])
-                if len(result.authors) > 3:
-                    authors_str += " et al."
-
-                item = NewsItem(
-                    title=result.title.strip().replace("\n", " "),
-                    url=result.entry_id,
-                    source="arxiv",
-                    source_name=", ".join(
-                        c.split(".")[-1] for c in (result.categories or [])
-                    ),
-                    content=(
-                        f"[Authors: {authors_str}] "
-                        + result.summary.strip().replace("\n", " ")
-                    ),
-                    published_at=result.published.replace(tzinfo=timezone.utc)
-                    if result.published
-                    else None,
-                )
-                items.append(item)
+            with httpx.Client(
+                timeout=60, headers=_HTTP_HEADERS, follow_redirects=True,
+            ) as client:
+                if self.use_oai:
+                    results = self._harvest_oai(client, keywords)
+                else:
+                    results = _iter_api_results(
+                        client, query, self.max_results,
+                        page_size=min(self.max_results, _API_PAGE_SIZE),
+                    )
+                for result in results:
+                    total_fetched += 1
+                    if self.require_institution and not _matches_institution(result, self._inst_matcher):
+                        skipped_institution += 1
+                        continue
+
+                    items.append(_result_to_item(result))
         except Exception:
             logger.exception("Failed to fetch arXiv papers")
+        else:
+            save_items("arxiv", cache_key, items)
 
         logger.info(
             "arXiv: fetched %d, skipped %d (institution filter), kept %d papers",
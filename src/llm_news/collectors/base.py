@@ -2,15 +2,63 @@
 
 所有 collector 的统一基类，提供标准化接口和注册机制。
 All collectors inherit from BaseCollector for a unified interface.
+
+异步 collector 共享同一个后台事件循环和同一个 httpx.AsyncClient，
+跨 collector 复用连接池（keep-alive），避免每个 collector 各自握手。
 """
 
+import asyncio
+import atexit
 import logging
+import threading
 from abc import ABC, abstractmethod
+from collections.abc import Coroutine
+from typing import Any, TypeVar
+
+import httpx
 
 from ..models import NewsItem
 
 logger = logging.getLogger(__name__)
 
+T = TypeVar("T")
+
+_HTTP_HEADERS = {
+    "User-Agent": "Mozilla/5.0 (compatible; llm-news/0.1; +https://github.com/llm-news)",
+}
+
+# Shared event loop + HTTP client / 共享事件循环与 HTTP 客户端（首次使用时创建）
+_lock = threading.Lock()
+_loop: asyncio.AbstractEventLoop | None = None
+_http_client: httpx.AsyncClient | None = None
+
+
+def _get_loop() -> asyncio.AbstractEventLoop:
+    """Return the shared event loop, starting its daemon thread on first use."""
+    global _loop
+    with _lock:
+        if _loop is None:
+            _loop = asyncio.new_event_loop()
+            threading.Thread(
+                target=_loop.run_forever, name="collector-loop", daemon=True,
+            ).start()
+            atexit.register(_shutdown)
+        return _loop
+
+
+def _shutdown() -> None:
+    """Close the shared client and stop the loop at interpreter exit."""
+    global _http_client
+    if _loop is None:
+        return
+    if _http_client is not None:
+        try:
+            asyncio.run_coroutine_threadsafe(_http_client.aclose(), _loop).result(timeout=5)
+        except Exception:
+            logger.debug("Failed to close shared HTTP client", exc_info=True)
+        _http_client = None
+    _loop.call_soon_threadsafe(_loop.stop)
+
 
 class BaseCollector(ABC):
     """Abstract base class for all news collectors.
@@ -35,5 +83,41 @@ class BaseCollector(ABC):
         """
         ...
 
+    async def acollect(self, keywords: list[str]) -> list[NewsItem]:
+        """Async variant of collect(), awaited by the pipeline on the shared loop.
+
+        默认在线程池中运行同步的 collect()；原生异步的 collector 覆盖此方法，
+        其 collect() 则通过 run_async(self.acollect(...)) 实现。
+        """
+        return await asyncio.to_thread(self.collect, keywords)
+
+    @staticmethod
+    def run_async(coro: Coroutine[Any, Any, T]) -> T:
+        """Run a coroutine on the shared event loop and block until it finishes.
+
+        collector 在线程池中调用，协程统一调度到共享事件循环上执行。
+        """
+        return asyncio.run_coroutine_threadsafe(coro, _get_loop()).result()
+
+    @classmethod
+    def get_http_client(cls) -> httpx.AsyncClient:
+        """Return the process-wide shared AsyncClient.
+
+        只能在共享事件循环（run_async）内使用；请求级 headers 按需传入。
+        """
+        global _http_client
+        _get_loop()
+        with _lock:
+            if _http_client is None:
+                _http_client = httpx.AsyncClient(
+                    timeout=30,
+                    headers=_HTTP_HEADERS,
+                    follow_redirects=True,
+                    limits=httpx.Limits(
+                        max_keepalive_connections=50, max_connections=100,
+                    ),
+                )
+            return _http_client
+
     def __repr__(self) -> str:
         return f"<{self.__class__.__name__} name={self.name!r} enabled={self.enabled}>"
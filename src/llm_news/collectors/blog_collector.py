@@ -1,50 +1,248 @@
 """Blog / RSS feed collector.
 
 Fetches recent posts from configured RSS feeds and filters by keywords.
-使用 httpx 获取内容 + feedparser 解析，兼容非标准 RSS/Atom。
+使用 httpx 获取内容；标准 RSS 2.0 / Atom 走 ElementTree 快速路径，
+只取用到的几个字段，其余（RSS 1.0、格式错误的 feed 等）回退 feedparser。
+所有 feed 通过共享 AsyncClient 并发拉取，总耗时 ≈ 最慢的单个 feed。
 """
 
+import asyncio
+import functools
+import html
 import logging
+import re
+import xml.etree.ElementTree as ET
 from datetime import datetime, timezone
-from time import mktime
+from email.utils import parsedate_to_datetime
 
 import feedparser
 import httpx
 
+from ..cache import load_validated, save_validated
 from ..models import NewsItem
+from ._keywords import compile_keywords, matches_keywords
 from .base import BaseCollector
 
 logger = logging.getLogger(__name__)
 
-_HTTP_HEADERS = {
-    "User-Agent": "Mozilla/5.0 (compatible; llm-news/0.1; +https://github.com/llm-news)",
+_FEED_HEADERS = {
     "Accept": "application/rss+xml, application/atom+xml, application/xml, text/xml, */*",
 }
 
+# Max concurrent feed fetches / 最大并发拉取数
+_MAX_CONCURRENCY = 8
+
+# 不解析 entry HTML 中的相对链接（只用 title/link/summary/content 文本，省去一遍 HTML 重写）。
+# HTML sanitization 保持开启：summary 会原样写入日报 Markdown / GitHub Pages。
+_parse_feed_fallback = functools.partial(feedparser.parse, resolve_relative_uris=False)
+
+# 每个 feed 只处理前 N 条 / Entries processed per feed
+_MAX_ENTRIES = 20
+
+_ATOM_NS = "{http://www.w3.org/2005/Atom}"
+_CONTENT_ENCODED = "{http://purl.org/rss/1.0/modules/content/}encoded"
+_DC_DATE = "{http://purl.org/dc/elements/1.1/}date"
+
+_SCRIPT_RE = re.compile(r"<(script|style)\b.*?</\1\s*>", re.IGNORECASE | re.DOTALL)
+_TAG_RE = re.compile(r"<[^>]*>")
+# RSS 标题无类型声明：含闭合标签或实体时按 HTML 处理（与 feedparser 的判断类似）
+_HTML_HINT_RE = re.compile(r"</\w+>|&#?\w+;")
+
+# 关键词匹配只看 summary / content 的前 N 个字符（全文 HTML 可能有 MB 级）
+# Per-field character budget for keyword matching
+_MATCH_BUDGET = 2000
+
 
 def _parse_published(entry: dict) -> datetime | None:
-    """Try to parse the published date from a feed entry."""
+    """Try to parse the published date from a feed entry.
+
+    feedparser 的 *_parsed 已是 UTC struct_time，直接构造 datetime，
+    不经 mktime（按本地时区换算，既慢又会引入时区偏差）。
+    """
     for key in ("published_parsed", "updated_parsed"):
         parsed = entry.get(key)
         if parsed:
             try:
-                return datetime.fromtimestamp(mktime(parsed), tz=timezone.utc)
-            except Exception:
+                return datetime(*parsed[:6], tzinfo=timezone.utc)
+            except (TypeError, ValueError):
                 pass
     return None
 
 
-def _matches_keywords(text: str, keywords: list[str]) -> bool:
-    """Check if text contains any of the keywords (case-insensitive)."""
-    text_lower = text.lower()
-    return any(kw.lower() in text_lower for kw in keywords)
+def _html_to_text(fragment: str) -> str:
+    """Reduce an HTML fragment to escaped plain text.
+
+    快速路径不经过 feedparser 的 sanitizer：去掉全部标签、解码实体后再转义尖括号，
+    写入 Markdown / GitHub Pages 时不会带入任何 HTML。
+    """
+    text = _TAG_RE.sub(" ", _SCRIPT_RE.sub(" ", fragment))
+    text = " ".join(html.unescape(text).split())
+    return text.replace("<", "&lt;").replace(">", "&gt;")
+
+
+def _title_text(value: str, is_html: bool) -> str:
+    """Reduce a feed title to plain text.
+
+    标题按纯文本使用：仅当标题为 HTML 时去标签、解码实体，且不再转义，
+    "A < B" 之类的标题与 feedparser 回退路径结果一致。
+    """
+    if is_html:
+        value = html.unescape(_TAG_RE.sub(" ", _SCRIPT_RE.sub(" ", value)))
+    return " ".join(value.split())
+
+
+def _text(elem: ET.Element | None) -> str:
+    return "".join(elem.itertext()).strip() if elem is not None else ""
+
+
+def _time_tuple(value: str, rfc822: bool) -> tuple[int, ...] | None:
+    """Parse an RSS (RFC 822) or Atom (ISO 8601) date into a UTC time tuple."""
+    if not value:
+        return None
+    try:
+        dt = parsedate_to_datetime(value) if rfc822 else datetime.fromisoformat(value)
+    except (TypeError, ValueError):
+        return None
+    if dt.tzinfo is None:
+        dt = dt.replace(tzinfo=timezone.utc)
+    return tuple(dt.utctimetuple())
+
+
+def _rss_entry(item: ET.Element) -> dict:
+    content = item.findtext(_CONTENT_ENCODED)
+    title = _text(item.find("title"))
+    return {
+        "title": _title_text(title, is_html=bool(_HTML_HINT_RE.search(title))),
+        "link": (item.findtext("link") or "").strip(),
+        "summary": _html_to_text(item.findtext("description") or ""),
+        "content": [{"value": _html_to_text(content)}] if content else [],
+        "published_parsed": _time_tuple(item.findtext("pubDate") or "", rfc822=True),
+        "updated_parsed": _time_tuple(item.findtext(_DC_DATE) or "", rfc822=False),
+    }
 
 
-def _fetch_and_parse(url: str, client: httpx.Client) -> feedparser.FeedParserDict:
-    """Fetch RSS content via httpx, then parse with feedparser."""
-    resp = client.get(url)
+def _atom_entry(entry: ET.Element) -> dict:
+    link = ""
+    for elem in entry.iterfind(f"{_ATOM_NS}link"):
+        if elem.get("rel", "alternate") == "alternate":
+            link = elem.get("href", "")
+            break
+    content = _text(entry.find(f"{_ATOM_NS}content"))
+    title = entry.find(f"{_ATOM_NS}title")
+    return {
+        "title": _title_text(
+            _text(title), is_html=title is not None and title.get("type") == "html",
+        ),
+        "link": link,
+        "summary": _html_to_text(_text(entry.find(f"{_ATOM_NS}summary"))),
+        "content": [{"value": _html_to_text(content)}] if content else [],
+        "published_parsed": _time_tuple(
+            entry.findtext(f"{_ATOM_NS}published") or "", rfc822=False,
+        ),
+        "updated_parsed": _time_tuple(
+            entry.findtext(f"{_ATOM_NS}updated") or "", rfc822=False,
+        ),
+    }
+
+
+def _parse_feed(content: bytes) -> feedparser.FeedParserDict:
+    """Parse a feed, trying the ElementTree fast path before feedparser.
+
+    只解析前 _MAX_ENTRIES 条的 5 个字段；非 RSS 2.0 / Atom 或 XML 不合法时
+    回退 feedparser（容错解析、RSS 1.0 等）。
+    """
+    try:
+        root = ET.fromstring(content)
+    except ET.ParseError:
+        root = None
+
+    if root is not None and root.tag == "rss":
+        items = root.iterfind("channel/item")
+        to_entry = _rss_entry
+    elif root is not None and root.tag == f"{_ATOM_NS}feed":
+        items = root.iterfind(f"{_ATOM_NS}entry")
+        to_entry = _atom_entry
+    else:
+        return _parse_feed_fallback(content)
+
+    entries = [to_entry(item) for _, item in zip(range(_MAX_ENTRIES), items)]
+    return feedparser.FeedParserDict(entries=entries, bozo=False)
+
+
+def _entries_to_items(
+    feed: feedparser.FeedParserDict,
+    blog_name: str,
+    kw_pattern: re.Pattern[str] | None,
+) -> list[NewsItem]:
+    """Convert the first feed entries to NewsItems, filtered by keywords."""
+    items: list[NewsItem] = []
+    for entry in feed.entries[:_MAX_ENTRIES]:
+        title = entry.get("title", "").strip()
+        link = entry.get("link", "")
+        summary = entry.get("summary", "").strip()
+        # summary 已占满匹配预算时无需再取 content（也不会用于存储）
+        content = ""
+        if len(summary) < _MATCH_BUDGET and entry.get("content"):
+            content = entry["content"][0].get("value", "")
+
+        text_for_match = (
+            f"{title} {summary[:_MATCH_BUDGET]} {content[:_MATCH_BUDGET]}"
+        )
+        if kw_pattern and not matches_keywords(text_for_match, kw_pattern):
+            continue
+
+        item = NewsItem(
+            title=title,
+            url=link,
+            source="blog",
+            source_name=blog_name,
+            content=summary or content[:500],
+            published_at=_parse_published(entry),
+        )
+        items.append(item)
+    return items
+
+
+async def _collect_feed(
+    blog: dict[str, str],
+    client: httpx.AsyncClient,
+    semaphore: asyncio.Semaphore,
+    kw_pattern: re.Pattern[str] | None,
+) -> list[NewsItem]:
+    """Fetch one RSS feed (conditionally), parse it and filter entries.
+
+    带 ETag / Last-Modified 条件请求；304 时直接复用上次结果，跳过下载与解析。
+    解析是同步 CPU 工作，放到线程池执行以免阻塞事件循环。
+    """
+    blog_name = blog.get("name", "Unknown")
+    url = blog["url"]
+    # 结果依赖关键词，缓存 key 同时包含 URL 和关键词
+    cache_key = f"{url}|{kw_pattern.pattern if kw_pattern else ''}"
+    validated = load_validated("blog", cache_key)
+
+    headers = dict(_FEED_HEADERS)
+    if validated:
+        headers.update(validated[0])
+
+    logger.info("Fetching RSS: %s (%s)", blog_name, url)
+    async with semaphore:
+        resp = await client.get(url, headers=headers)
+    if resp.status_code == 304 and validated:
+        logger.debug("RSS not modified: %s", blog_name)
+        return validated[1]
     resp.raise_for_status()
-    return feedparser.parse(resp.content)
+
+    loop = asyncio.get_running_loop()
+    feed = await loop.run_in_executor(None, _parse_feed, resp.content)
+    if feed.bozo and not feed.entries:
+        logger.warning(
+            "Failed to parse RSS for %s: %s", blog_name, feed.bozo_exception,
+        )
+        return []
+
+    items = _entries_to_items(feed, blog_name, kw_pattern)
+    save_validated("blog", cache_key, resp.headers, items)
+    return items
 
 
 class BlogCollector(BaseCollector):
@@ -55,61 +253,41 @@ class BlogCollector(BaseCollector):
 
     name = "blog"
 
-    def __init__(self, blogs: list[dict[str, str]] | None = None) -> None:
+    def __init__(
+        self,
+        blogs: list[dict[str, str]] | None = None,
+        http: httpx.AsyncClient | None = None,
+    ) -> None:
         """Args:
             blogs: List of {"name": ..., "url": ...} dicts.
+            http: AsyncClient to use; defaults to the shared client.
         """
         self.blogs = blogs or []
+        self.http = http
 
     def collect(self, keywords: list[str]) -> list[NewsItem]:
+        return self.run_async(self.acollect(keywords))
+
+    async def acollect(self, keywords: list[str]) -> list[NewsItem]:
         items: list[NewsItem] = []
+        kw_pattern = compile_keywords(tuple(keywords))
+        blogs = [b for b in self.blogs if b.get("url")]
+        semaphore = asyncio.Semaphore(_MAX_CONCURRENCY)
+
+        client = self.http or self.get_http_client()
+        results = await asyncio.gather(
+            *(_collect_feed(b, client, semaphore, kw_pattern) for b in blogs),
+            return_exceptions=True,
+        )
 
-        with httpx.Client(
-            timeout=30, headers=_HTTP_HEADERS, follow_redirects=True,
-        ) as client:
-            for blog in self.blogs:
-                blog_name = blog.get("name", "Unknown")
-                blog_url = blog.get("url", "")
-                if not blog_url:
-                    continue
-
-                logger.info("Fetching RSS: %s (%s)", blog_name, blog_url)
-                try:
-                    feed = _fetch_and_parse(blog_url, client)
-
-                    if feed.bozo and not feed.entries:
-                        logger.warning(
-                            "Failed to parse RSS for %s: %s",
-                            blog_name, feed.bozo_exception,
-                        )
-                        continue
-
-                    for entry in feed.entries[:20]:
-                        title = entry.get("title", "").strip()
-                        link = entry.get("link", "")
-                        summary = entry.get("summary", "").strip()
-                        content = (
-                            entry.get("content", [{}])[0].get("value", "")
-                            if entry.get("content")
-                            else ""
-                        )
-
-                        text_for_match = f"{title} {summary} {content}"
-                        if keywords and not _matches_keywords(text_for_match, keywords):
-                            continue
-
-                        item = NewsItem(
-                            title=title,
-                            url=link,
-                            source="blog",
-                            source_name=blog_name,
-                            content=summary or content[:500],
-                            published_at=_parse_published(entry),
-                        )
-                        items.append(item)
-
-                except Exception:
-                    logger.exception("Failed to fetch RSS for %s", blog_name)
+        for blog, result in zip(blogs, results):
+            if isinstance(result, BaseException):
+                logger.error(
+                    "Failed to fetch RSS for %s", blog.get("name", "Unknown"),
+                    exc_info=result,
+                )
+                continue
+            items.extend(result)
 
         logger.info("Blogs: collected %d posts", len(items))
         return items
@@ -1,20 +1,86 @@
 """GitHub release collector.
 
-Tracks releases from configured repositories via GitHub REST API.
+Tracks releases from configured repositories via GitHub API.
+有 token 时通过 GraphQL 一次请求批量拉取多个仓库的 release，失败回退 REST。
+REST 请求按仓库并发发出（有并发上限）。
 GitHub API 免费 5000 req/h (with token), 60 req/h (anonymous).
 """
 
+import asyncio
+import json
 import logging
+import time
 from datetime import datetime, timezone
 
 import httpx
 
+from ..cache import load_items, load_validated, save_items, save_validated
 from ..models import NewsItem
+from ._time import parse_iso, utc_today
 from .base import BaseCollector
 
 logger = logging.getLogger(__name__)
 
 GITHUB_API = "https://api.github.com"
+GITHUB_GRAPHQL_API = "https://api.github.com/graphql"
+
+# Release 列表缓存 1h，key 含 UTC 日期 / cache per-repo releases for 1h, keyed per UTC day
+_CACHE_TTL = 3600
+
+# 每个 GraphQL 请求最多查询的仓库数（控制 node 数量上限）
+# Max repos per GraphQL query, keeps us well under the node-count limit
+_GRAPHQL_BATCH_SIZE = 50
+
+# REST 最大并发数：GitHub 不鼓励大量并发请求（secondary rate limit）
+# Max concurrent REST requests, GitHub discourages heavy concurrency
+_MAX_CONCURRENCY = 8
+
+# 剩余配额不高于此值时停止发 REST 请求（留出并发中在途请求的余量），
+# 改用上次缓存的结果；匿名配额仅 60 次/小时
+# Stop issuing REST requests once the remaining quota drops to this level
+_RATE_LIMIT_RESERVE = _MAX_CONCURRENCY
+
+_GRAPHQL_REPO_FRAGMENT = """
+  r{index}: repository(owner: {owner}, name: {name}) {{
+    releases(first: 5, orderBy: {{field: CREATED_AT, direction: DESC}}) {{
+      nodes {{ tagName name description publishedAt url }}
+    }}
+  }}"""
+
+
+def _release_to_item(
+    repo: str,
+    tag: str,
+    name: str,
+    body: str,
+    html_url: str,
+    published_str: str,
+) -> NewsItem:
+    """Convert release fields (REST or GraphQL) to a NewsItem."""
+    return NewsItem(
+        title=f"{repo} {name or tag}",
+        url=html_url,
+        source="github",
+        source_name=repo,
+        content=body[:1000],
+        published_at=parse_iso(published_str),
+    )
+
+
+def _parse_releases(repo: str, data: list[dict]) -> list[NewsItem]:
+    """Convert a REST releases payload to NewsItems."""
+    items: list[NewsItem] = []
+    for release in data:
+        get = release.get
+        items.append(_release_to_item(
+            repo,
+            tag=get("tag_name") or "",
+            name=get("name") or "",
+            body=get("body") or "",
+            html_url=get("html_url") or "",
+            published_str=get("published_at") or "",
+        ))
+    return items
 
 
 class GithubCollector(BaseCollector):
@@ -29,9 +95,14 @@ class GithubCollector(BaseCollector):
         self,
         repos: list[str] | None = None,
         token: str = "",
+        http: httpx.AsyncClient | None = None,
     ) -> None:
         self.repos = repos or []
         self.token = token
+        self.http = http
+        # 最近一次响应中的 X-RateLimit-Remaining / X-RateLimit-Reset
+        self._rate_remaining: int | None = None
+        self._rate_reset = 0
 
     def _get_headers(self) -> dict[str, str]:
         headers = {"Accept": "application/vnd.github+json"}
@@ -39,51 +110,166 @@ class GithubCollector(BaseCollector):
             headers["Authorization"] = f"Bearer {self.token}"
         return headers
 
-    def collect(self, keywords: list[str]) -> list[NewsItem]:
-        items: list[NewsItem] = []
+    async def _fetch_graphql(
+        self, client: httpx.AsyncClient, repos: list[str],
+    ) -> dict[str, list[NewsItem]]:
+        """Fetch latest releases for a batch of repos in one GraphQL query.
+
+        GraphQL 批量查询；不存在的仓库返回 null，按无 release 处理（与 REST 404 一致）。
+        """
+        fragments = []
+        for i, repo in enumerate(repos):
+            owner, _, name = repo.partition("/")
+            fragments.append(_GRAPHQL_REPO_FRAGMENT.format(
+                index=i, owner=json.dumps(owner), name=json.dumps(name),
+            ))
+        query = "query {" + "".join(fragments) + "\n}"
+
+        resp = await client.post(
+            GITHUB_GRAPHQL_API, json={"query": query}, headers=self._get_headers(),
+        )
+        resp.raise_for_status()
+        data = resp.json().get("data")
+        if data is None:
+            raise RuntimeError(f"GraphQL returned no data: {resp.text[:200]}")
+
+        results: dict[str, list[NewsItem]] = {}
+        for i, repo in enumerate(repos):
+            node = data.get(f"r{i}")
+            if node is None:
+                logger.debug("No releases for %s, skipping", repo)
+                continue
+            results[repo] = [
+                _release_to_item(
+                    repo,
+                    tag=rel.get("tagName") or "",
+                    name=rel.get("name") or "",
+                    body=rel.get("description") or "",
+                    html_url=rel.get("url") or "",
+                    published_str=rel.get("publishedAt") or "",
+                )
+                for rel in node["releases"]["nodes"]
+            ]
+        return results
+
+    def _update_rate_limit(self, resp: httpx.Response) -> None:
+        remaining = resp.headers.get("x-ratelimit-remaining", "")
+        if remaining.isdigit():
+            self._rate_remaining = int(remaining)
+            reset = resp.headers.get("x-ratelimit-reset", "")
+            self._rate_reset = int(reset) if reset.isdigit() else 0
+
+    def _rate_limited(self) -> bool:
+        return (
+            self._rate_remaining is not None
+            and self._rate_remaining <= _RATE_LIMIT_RESERVE
+            and time.time() < self._rate_reset
+        )
+
+    async def _fetch_rest(
+        self, client: httpx.AsyncClient, repo: str,
+    ) -> list[NewsItem] | None:
+        """Fetch latest releases for one repo via REST. Returns None on 404.
+
+        带 ETag 条件请求：304 不计入 GitHub 速率限制，且直接复用上次结果。
+        配额将尽或已被限流时不再请求，返回上次缓存的结果（无缓存则返回 None）。
+        """
         headers = self._get_headers()
+        validated = load_validated("github_etag", repo)
+        if validated:
+            headers.update(validated[0])
 
-        with httpx.Client(timeout=30, headers=headers, follow_redirects=True) as client:
-            for repo in self.repos:
-                logger.info("Fetching GitHub releases: %s", repo)
+        if self._rate_limited():
+            logger.debug("GitHub rate limit reserve reached, using cached releases: %s", repo)
+            return validated[1] if validated else None
+
+        resp = await client.get(
+            f"{GITHUB_API}/repos/{repo}/releases",
+            params={"per_page": 5},
+            headers=headers,
+        )
+        self._update_rate_limit(resp)
+        if resp.status_code in (403, 429) and self._rate_limited():
+            logger.debug("GitHub rate limited, using cached releases: %s", repo)
+            return validated[1] if validated else None
+        if resp.status_code == 304 and validated:
+            logger.debug("GitHub releases not modified: %s", repo)
+            return validated[1]
+        if resp.status_code == 404:
+            return None
+        resp.raise_for_status()
+
+        items = _parse_releases(repo, resp.json())
+        save_validated("github_etag", repo, resp.headers, items)
+        return items
+
+    def collect(self, keywords: list[str]) -> list[NewsItem]:
+        return self.run_async(self.acollect(keywords))
+
+    async def acollect(self, keywords: list[str]) -> list[NewsItem]:
+        fetched: dict[str, list[NewsItem]] = {}
+        pending: list[str] = []
+        today = utc_today()
+
+        for repo in self.repos:
+            cached = load_items("github", f"{repo}|{today}", _CACHE_TTL)
+            if cached is not None:
+                logger.debug("GitHub releases cache hit: %s", repo)
+                fetched[repo] = cached
+            else:
+                pending.append(repo)
+
+        client = self.http or self.get_http_client()
+        # GraphQL API 需要认证；匿名时直接走 REST
+        # GraphQL requires auth, anonymous runs go straight to REST
+        if self.token and pending:
+            resolved: set[str] = set()
+            for start in range(0, len(pending), _GRAPHQL_BATCH_SIZE):
+                batch = pending[start:start + _GRAPHQL_BATCH_SIZE]
+                logger.info("Fetching GitHub releases via GraphQL: %d repos", len(batch))
                 try:
-                    resp = client.get(
-                        f"{GITHUB_API}/repos/{repo}/releases",
-                        params={"per_page": 5},
+                    results = await self._fetch_graphql(client, batch)
+                except Exception:
+                    logger.warning(
+                        "GraphQL release fetch failed, falling back to REST",
+                        exc_info=True,
                     )
-                    if resp.status_code == 404:
-                        logger.debug("No releases for %s, skipping", repo)
-                        continue
-                    resp.raise_for_status()
-
-                    for release in resp.json():
-                        tag = release.get("tag_name", "")
-                        name = release.get("name", "") or tag
-                        body = release.get("body", "") or ""
-                        html_url = release.get("html_url", "")
-                        published_str = release.get("published_at", "")
-
-                        published_at = None
-                        if published_str:
-                            try:
-                                published_at = datetime.fromisoformat(
-                                    published_str.replace("Z", "+00:00")
-                                )
-                            except ValueError:
-                                pass
-
-                        item = NewsItem(
-                            title=f"{repo} {name}",
-                            url=html_url,
-                            source="github",
-                            source_name=repo,
-                            content=body[:1000],
-                            published_at=published_at,
-                        )
-                        items.append(item)
+                    continue
+                for repo, repo_items in results.items():
+                    save_items("github", f"{repo}|{today}", repo_items)
+                    fetched[repo] = repo_items
+                resolved.update(batch)
+            pending = [r for r in pending if r not in resolved]
 
-                except Exception:
-                    logger.exception("Failed to fetch releases for %s", repo)
+        semaphore = asyncio.Semaphore(_MAX_CONCURRENCY)
+
+        async def fetch(repo: str) -> list[NewsItem] | None:
+            async with semaphore:
+                logger.info("Fetching GitHub releases: %s", repo)
+                return await self._fetch_rest(client, repo)
+
+        results = await asyncio.gather(
+            *(fetch(repo) for repo in pending), return_exceptions=True,
+        )
+        if self._rate_limited():
+            logger.warning(
+                "GitHub REST quota nearly exhausted (%d left, resets %s UTC); "
+                "remaining repos used cached releases",
+                self._rate_remaining,
+                datetime.fromtimestamp(self._rate_reset, tz=timezone.utc).strftime("%H:%M"),
+            )
+        for repo, repo_items in zip(pending, results):
+            if isinstance(repo_items, BaseException):
+                logger.error(
+                    "Failed to fetch releases for %s", repo, exc_info=repo_items,
+                )
+                continue
+            if repo_items is None:
+                logger.debug("No releases for %s, skipping", repo)
+                continue
+            save_items("github", f"{repo}|{today}", repo_items)
+            fetched[repo] = repo_items
 
+        items = [item for repo in self.repos for item in fetched.get(repo, [])]
         logger.info("GitHub: collected %d releases", len(items))
         return items
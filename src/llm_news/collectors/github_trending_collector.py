@@ -12,16 +12,20 @@ from datetime import datetime, timedelta, timezone
 import httpx
 
 from ..models import NewsItem
+from ._keywords import compile_keywords, matches_keywords
+from ._time import parse_iso
 from .base import BaseCollector
 
 logger = logging.getLogger(__name__)
 
 GITHUB_SEARCH_API = "https://api.github.com/search/repositories"
 
-
-def _matches_keywords(text: str, keywords: list[str]) -> bool:
-    text_lower = text.lower()
-    return any(kw.lower() in text_lower for kw in keywords)
+# period -> 回溯天数 / lookback days per period
+_PERIOD_DAYS: dict[str, int] = {
+    "past_24_hours": 1,
+    "past_week": 7,
+    "past_month": 30,
+}
 
 
 class GithubTrendingCollector(BaseCollector):
@@ -38,32 +42,37 @@ class GithubTrendingCollector(BaseCollector):
         period: str = "past_24_hours",
         language: str = "Python",
         token: str = "",
+        http: httpx.AsyncClient | None = None,
     ) -> None:
         self.period = period
         self.language = language
         self.token = token
+        self.http = http
 
     def _get_pushed_after(self) -> str:
         """Convert period to a date string for GitHub search.
 
         将 period 转换为 GitHub 搜索的日期字符串。
         """
-        days_map = {
-            "past_24_hours": 1,
-            "past_week": 7,
-            "past_month": 30,
-        }
-        days = days_map.get(self.period, 1)
+        days = _PERIOD_DAYS.get(self.period, 1)
         dt = datetime.now(timezone.utc) - timedelta(days=days)
-        return dt.strftime("%Y-%m-%d")
+        return dt.date().isoformat()
 
     def collect(self, keywords: list[str]) -> list[NewsItem]:
+        return self.run_async(self.acollect(keywords))
+
+    async def acollect(self, keywords: list[str]) -> list[NewsItem]:
         items: list[NewsItem] = []
+        kw_pattern = compile_keywords(tuple(keywords))
         pushed_after = self._get_pushed_after()
 
         # Build search queries for AI/LLM topics
         # 构建 AI/LLM 相关的搜索查询
         search_terms = ["LLM", "large language model", "transformer", "AI agent"]
+        # 合并为一个 OR 查询：Search API 限流严格（匿名 10 次/分钟），1 次请求代替 4 次
+        # One OR query instead of one request per term (search is tightly rate-limited)
+        terms_q = " OR ".join(f'"{t}"' if " " in t else t for t in search_terms)
+        query = f"({terms_q}) language:{self.language} pushed:>{pushed_after}"
 
         headers: dict[str, str] = {
             "Accept": "application/vnd.github+json",
@@ -75,75 +84,60 @@ class GithubTrendingCollector(BaseCollector):
         seen_repos: set[str] = set()
 
         try:
-            with httpx.Client(timeout=30, headers=headers, follow_redirects=True) as client:
-                for term in search_terms:
-                    query = f"{term} language:{self.language} pushed:>{pushed_after}"
-                    logger.info("GitHub Trending search: %s", query)
-
-                    try:
-                        resp = client.get(
-                            GITHUB_SEARCH_API,
-                            params={
-                                "q": query,
-                                "sort": "stars",
-                                "order": "desc",
-                                "per_page": 15,
-                            },
-                        )
-                        resp.raise_for_status()
-                        data = resp.json()
-
-                        for repo in data.get("items", []):
-                            full_name = repo.get("full_name", "")
-                            if not full_name or full_name in seen_repos:
-                                continue
-                            seen_repos.add(full_name)
-
-                            description = repo.get("description", "") or ""
-                            stars = repo.get("stargazers_count", 0)
-                            forks = repo.get("forks_count", 0)
-                            language = repo.get("language", "")
-                            topics = repo.get("topics", [])
-
-                            # Keyword filter / 关键词过滤
-                            text_for_match = f"{full_name} {description} {' '.join(topics)}"
-                            if keywords and not _matches_keywords(text_for_match, keywords):
-                                continue
-
-                            content_parts = [description]
-                            if stars:
-                                content_parts.append(f"Stars: {stars:,}")
-                            if forks:
-                                content_parts.append(f"Forks: {forks:,}")
-                            if language:
-                                content_parts.append(f"Language: {language}")
-                            if topics:
-                                content_parts.append(f"Topics: {', '.join(topics[:5])}")
-
-                            updated_str = repo.get("pushed_at", "")
-                            published_at = None
-                            if updated_str:
-                                try:
-                                    published_at = datetime.fromisoformat(
-                                        updated_str.replace("Z", "+00:00")
-                                    )
-                                except ValueError:
-                                    pass
-
-                            item = NewsItem(
-                                title=f"[Trending] {full_name}",
-                                url=repo.get("html_url", f"https://github.com/{full_name}"),
-                                source="github_trending",
-                                source_name="GitHub Trending",
-                                content=" | ".join(content_parts),
-                                score=float(stars),
-                                published_at=published_at,
-                            )
-                            items.append(item)
-
-                    except Exception:
-                        logger.warning("GitHub search failed for term: %s", term)
-                        continue
+            client = self.http or self.get_http_client()
+            logger.info("GitHub Trending search: %s", query)
+            resp = await client.get(
+                GITHUB_SEARCH_API,
+                params={
+                    "q": query,
+                    "sort": "stars",
+                    "order": "desc",
+                    "per_page": 15 * len(search_terms),
+                },
+                headers=headers,
+            )
+            resp.raise_for_status()
+            data = resp.json()
+
+            for repo in data.get("items", []):
+                full_name = repo.get("full_name", "")
+                if not full_name or full_name in seen_repos:
+                    continue
+                seen_repos.add(full_name)
+
+                description = repo.get("description", "") or ""
+                stars = repo.get("stargazers_count", 0)
+                forks = repo.get("forks_count", 0)
+                language = repo.get("language", "")
+                topics = repo.get("topics", [])
+
+                # Keyword filter / 关键词过滤
+                text_for_match = " ".join((full_name, description, *topics))
+                if kw_pattern and not matches_keywords(text_for_match, kw_pattern):
+                    continue
+
+                content_parts = [description]
+                if stars:
+                    content_parts.append(f"Stars: {stars:,}")
+                if forks:
+                    content_parts.append(f"Forks: {forks:,}")
+                if language:
+                    content_parts.append(f"Language: {language}")
+                if topics:
+                    content_parts.append(f"Topics: {', '.join(topics[:5])}")
+
+                published_at = parse_iso(repo.get("pushed_at") or "")
+
+                item = NewsItem(
+                    title=f"[Trending] {full_name}",
+                    url=repo.get("html_url", f"https://github.com/{full_name}"),
+                    source="github_trending",
+                    source_name="GitHub Trending",
+                    content=" | ".join(content_parts),
+                    score=float(stars),
+                    published_at=published_at,
+                )
+                items.append(item)
 
         except Exception:
             logger.exception("Failed to fetch GitHub trending repos")
@@ -1,27 +1,99 @@
 """Hacker News collector.
 
 Fetches top/best stories from HN and filters for AI/LLM-related content.
-HN Firebase API 免费，无需 API Key，无速率限制。
+newstories 优先走 Algolia HN Search API，一次请求拿到全部字段；
+失败、Algolia 返回不足 limit 条，或其他 story_type（topstories / beststories）
+走 Firebase API（列表 + 逐条并发拉取详情）。
+两者均免费，无需 API Key。
 
-API docs: https://github.com/HackerNews/API
+API docs: https://github.com/HackerNews/API, https://hn.algolia.com/api
 """
 
+import asyncio
 import logging
-from datetime import datetime, timezone
+import re
 
 import httpx
 
 from ..models import NewsItem
+from ._keywords import compile_keywords, matches_keywords
+from ._time import from_epoch
 from .base import BaseCollector
 
 logger = logging.getLogger(__name__)
 
 HN_API_BASE = "https://hacker-news.firebaseio.com/v0"
-
-
-def _matches_keywords(text: str, keywords: list[str]) -> bool:
-    text_lower = text.lower()
-    return any(kw.lower() in text_lower for kw in keywords)
+HN_ALGOLIA_API = "https://hn.algolia.com/api/v1"
+
+# story_type -> (Algolia endpoint, tags, 可返回的最大条数)
+# 无对应查询的类型只走 Firebase。topstories 不走 Algolia：front_page 标签只覆盖首页
+# 约 30 条，而默认 limit 为 60、Firebase topstories 有 ~500 条
+_ALGOLIA_QUERIES: dict[str, tuple[str, str, int]] = {
+    "newstories": ("search_by_date", "story", 1000),
+}
+
+# Max concurrent item fetches / 最大并发拉取数
+_MAX_CONCURRENCY = 20
+
+
+def _to_item(
+    story_id: int | str,
+    title: str,
+    url: str,
+    text: str,
+    score: int,
+    comments: int,
+    timestamp: int | None,
+    kw_pattern: re.Pattern[str] | None,
+) -> NewsItem | None:
+    """Build a NewsItem from story fields (Firebase or Algolia), filtered by keywords."""
+    title = title.strip()
+    if not url:
+        url = f"https://news.ycombinator.com/item?id={story_id}"
+
+    text_for_match = f"{title} {text}"
+    if kw_pattern and not matches_keywords(text_for_match, kw_pattern):
+        return None
+
+    published_at = None
+    if timestamp:
+        published_at = from_epoch(timestamp)
+
+    return NewsItem(
+        title=title,
+        url=url,
+        source="hackernews",
+        source_name="Hacker News",
+        content=f"[HN Score: {score}, Comments: {comments}] {text[:500]}",
+        score=float(score),
+        published_at=published_at,
+    )
+
+
+async def _fetch_story(
+    client: httpx.AsyncClient,
+    story_id: int,
+    semaphore: asyncio.Semaphore,
+    kw_pattern: re.Pattern[str] | None,
+) -> NewsItem | None:
+    """Fetch one story and convert it to a NewsItem if it matches keywords."""
+    async with semaphore:
+        r = await client.get(f"{HN_API_BASE}/item/{story_id}.json")
+    r.raise_for_status()
+    story = r.json()
+    if not story or story.get("type") != "story":
+        return None
+
+    return _to_item(
+        story_id,
+        title=story.get("title") or "",
+        url=story.get("url") or "",
+        text=story.get("text") or "",
+        score=story.get("score") or 0,
+        comments=story.get("descendants") or 0,
+        timestamp=story.get("time"),
+        kw_pattern=kw_pattern,
+    )
 
 
 class HackerNewsCollector(BaseCollector):
@@ -36,68 +108,107 @@ class HackerNewsCollector(BaseCollector):
         self,
         story_type: str = "topstories",
         limit: int = 60,
+        http: httpx.AsyncClient | None = None,
     ) -> None:
         self.story_type = story_type
         self.limit = limit
+        self.http = http
 
     def collect(self, keywords: list[str]) -> list[NewsItem]:
-        items: list[NewsItem] = []
-
-        try:
-            with httpx.Client(timeout=30, follow_redirects=True) as client:
-                resp = client.get(f"{HN_API_BASE}/{self.story_type}.json")
-                resp.raise_for_status()
-                story_ids: list[int] = resp.json()[: self.limit]
-
-                logger.info(
-                    "HN: fetching details for %d/%d %s",
-                    len(story_ids), len(resp.json()), self.story_type,
+        return self.run_async(self.acollect(keywords))
+
+    async def acollect(self, keywords: list[str]) -> list[NewsItem]:
+        items: list[NewsItem] | None = None
+        kw_pattern = compile_keywords(tuple(keywords))
+        client = self.http or self.get_http_client()
+
+        query = _ALGOLIA_QUERIES.get(self.story_type)
+        if query is not None and self.limit > query[2]:
+            logger.debug(
+                "HN: limit %d exceeds Algolia %s coverage (~%d), using Firebase API",
+                self.limit, self.story_type, query[2],
+            )
+        elif query is not None:
+            try:
+                items = await self._collect_algolia(client, kw_pattern)
+            except Exception:
+                logger.warning(
+                    "HN Algolia search failed, falling back to Firebase API",
+                    exc_info=True,
                 )
 
-                for story_id in story_ids:
-                    try:
-                        r = client.get(f"{HN_API_BASE}/item/{story_id}.json")
-                        r.raise_for_status()
-                        story = r.json()
-                        if not story or story.get("type") != "story":
-                            continue
-
-                        title = story.get("title", "").strip()
-                        url = story.get("url", "")
-                        text = story.get("text", "") or ""
-                        score = story.get("score", 0)
-
-                        hn_url = f"https://news.ycombinator.com/item?id={story_id}"
-                        if not url:
-                            url = hn_url
-
-                        text_for_match = f"{title} {text}"
-                        if keywords and not _matches_keywords(text_for_match, keywords):
-                            continue
-
-                        published_at = None
-                        if story.get("time"):
-                            published_at = datetime.fromtimestamp(
-                                story["time"], tz=timezone.utc
-                            )
-
-                        item = NewsItem(
-                            title=title,
-                            url=url,
-                            source="hackernews",
-                            source_name="Hacker News",
-                            content=f"[HN Score: {score}, Comments: {story.get('descendants', 0)}] {text[:500]}",
-                            score=float(score),
-                            published_at=published_at,
-                        )
-                        items.append(item)
-
-                    except Exception:
-                        logger.debug("Failed to fetch HN story %d", story_id)
-                        continue
-
-        except Exception:
-            logger.exception("Failed to fetch Hacker News stories")
+        if items is None:
+            try:
+                items = await self._collect_firebase(client, kw_pattern)
+            except Exception:
+                logger.exception("Failed to fetch Hacker News stories")
+                items = []
 
         logger.info("HN: collected %d stories (after keyword filter)", len(items))
         return items
+
+    async def _collect_algolia(
+        self, client: httpx.AsyncClient, kw_pattern: re.Pattern[str] | None,
+    ) -> list[NewsItem] | None:
+        """Fetch stories with full fields in a single Algolia search request.
+
+        返回条数不足 limit 时返回 None，由调用方回退 Firebase。
+        """
+        endpoint, tags, _ = _ALGOLIA_QUERIES[self.story_type]
+        resp = await client.get(
+            f"{HN_ALGOLIA_API}/{endpoint}",
+            params={"tags": tags, "hitsPerPage": self.limit},
+        )
+        resp.raise_for_status()
+        hits: list[dict] = resp.json()["hits"]
+        if len(hits) < self.limit:
+            logger.info(
+                "HN: Algolia returned only %d/%d %s, falling back to Firebase API",
+                len(hits), self.limit, self.story_type,
+            )
+            return None
+        logger.info("HN: fetched %d %s via Algolia", len(hits), self.story_type)
+
+        items: list[NewsItem] = []
+        for hit in hits:
+            item = _to_item(
+                hit["objectID"],
+                title=hit.get("title") or "",
+                url=hit.get("url") or "",
+                text=hit.get("story_text") or "",
+                score=hit.get("points") or 0,
+                comments=hit.get("num_comments") or 0,
+                timestamp=hit.get("created_at_i"),
+                kw_pattern=kw_pattern,
+            )
+            if item is not None:
+                items.append(item)
+        return items
+
+    async def _collect_firebase(
+        self, client: httpx.AsyncClient, kw_pattern: re.Pattern[str] | None,
+    ) -> list[NewsItem]:
+        """Fetch the story-ID list, then each story's details concurrently."""
+        resp = await client.get(f"{HN_API_BASE}/{self.story_type}.json")
+        resp.raise_for_status()
+        # 只解析一次 ID 列表（~500 个）
+        all_ids: list[int] = resp.json()
+        story_ids = all_ids[: self.limit]
+
+        logger.info(
+            "HN: fetching details for %d/%d %s",
+            len(story_ids), len(all_ids), self.story_type,
+        )
+
+        semaphore = asyncio.Semaphore(_MAX_CONCURRENCY)
+        results = await asyncio.gather(
+            *(_fetch_story(client, sid, semaphore, kw_pattern) for sid in story_ids),
+            return_exceptions=True,
+        )
+        items: list[NewsItem] = []
+        for story_id, result in zip(story_ids, results):
+            if isinstance(result, BaseException):
+                logger.debug("Failed to fetch HN story %d", story_id)
+            elif result is not None:
+                items.append(result)
+        return items
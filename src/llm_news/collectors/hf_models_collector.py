@@ -7,18 +7,34 @@ API: https://huggingface.co/api/models
 覆盖中国大模型公司：DeepSeek, Qwen, GLM, Kimi, MiniMax, StepFun 等。
 """
 
+import asyncio
 import logging
-from datetime import datetime, timezone
 
 import httpx
 
+from ..cache import load_validated_json, save_validated_json
 from ..models import NewsItem
+from ._time import parse_iso
 from .base import BaseCollector
 
 logger = logging.getLogger(__name__)
 
 HF_MODELS_API = "https://huggingface.co/api/models"
 
+# _model_to_item 用到的字段；解析后立即裁剪，其余字段不驻留内存、不写入缓存
+# Fields used by _model_to_item; everything else is dropped right after parsing
+_MODEL_FIELDS = ("id", "pipeline_tag", "downloads", "likes", "lastModified")
+
+
+def _slim_models(models: list[dict]) -> list[dict]:
+    """Project API model dicts down to the fields we use (first 10 tags only)."""
+    slim = []
+    for model in models:
+        entry = {k: model[k] for k in _MODEL_FIELDS if k in model}
+        entry["tags"] = model.get("tags", [])[:10]
+        slim.append(entry)
+    return slim
+
 
 class HfModelsCollector(BaseCollector):
     """HuggingFace Models collector.
@@ -33,6 +49,7 @@ class HfModelsCollector(BaseCollector):
         self,
         orgs: list[str] | None = None,
         limit: int = 50,
+        http: httpx.AsyncClient | None = None,
     ) -> None:
         self.orgs = orgs or [
             "deepseek-ai",  # DeepSeek
@@ -47,16 +64,19 @@ class HfModelsCollector(BaseCollector):
             "openai",  # OpenAI
         ]
         self.limit = limit
+        self.http = http
 
-    def _fetch_org_models(
-        self, client: httpx.Client, org: str
+    async def _fetch_org_models(
+        self, client: httpx.AsyncClient, org: str
     ) -> list[dict]:
         """Fetch recently updated models for a given HF organization.
 
         按最近更新排序获取指定组织的模型列表。
+        带 ETag 条件请求，304 时复用上次的响应。
         """
         try:
-            resp = client.get(
+            validated = load_validated_json("hf_models", org)
+            resp = await client.get(
                 HF_MODELS_API,
                 params={
                     "author": org,
@@ -64,20 +84,26 @@ class HfModelsCollector(BaseCollector):
                     "direction": -1,
                     "limit": 10,
                 },
+                headers=validated[0] if validated else None,
             )
+            if resp.status_code == 304 and validated:
+                logger.debug("HF models not modified: %s", org)
+                return validated[1]
             resp.raise_for_status()
-            return resp.json()
+            models = _slim_models(resp.json())
+            save_validated_json("hf_models", org, resp.headers, models)
+            return models
         except Exception:
             logger.warning("Failed to fetch HF models for org: %s", org)
             return []
 
-    def _fetch_trending(self, client: httpx.Client) -> list[dict]:
+    async def _fetch_trending(self, client: httpx.AsyncClient) -> list[dict]:
         """Fetch globally popular models (sorted by likes).
 
         获取全局热门模型（按 likes 排序，HF API 不支持 sort=trending）。
         """
         try:
-            resp = client.get(
+            resp = await client.get(
                 HF_MODELS_API,
                 params={
                     "sort": "likes",
@@ -87,34 +113,32 @@ class HfModelsCollector(BaseCollector):
                 },
             )
             resp.raise_for_status()
-            return resp.json()
+            return _slim_models(resp.json())
         except Exception:
             logger.warning("Failed to fetch trending HF models")
             return []
 
     def collect(self, keywords: list[str]) -> list[NewsItem]:
+        return self.run_async(self.acollect(keywords))
+
+    async def acollect(self, keywords: list[str]) -> list[NewsItem]:
         items: list[NewsItem] = []
         seen_ids: set[str] = set()
 
-        with httpx.Client(timeout=30, follow_redirects=True) as client:
-            # 1. Fetch models from each tracked org / 按组织拉取
-            for org in self.orgs:
-                logger.info("Fetching HF models for org: %s", org)
-                models = self._fetch_org_models(client, org)
-                for model in models:
-                    model_id = model.get("id", "")
-                    if not model_id or model_id in seen_ids:
-                        continue
-                    seen_ids.add(model_id)
-
-                    item = self._model_to_item(model)
-                    if item:
-                        items.append(item)
-
-            # 2. Fetch globally trending text-generation models / 全局热门
-            logger.info("Fetching trending HF text-generation models")
-            trending = self._fetch_trending(client)
-            for model in trending:
+        client = self.http or self.get_http_client()
+        # 各组织列表 + 全局热门并发拉取，结果按原顺序去重
+        # Fetch all org listings and the trending list concurrently
+        logger.info(
+            "Fetching HF models for %d orgs + trending text-generation models",
+            len(self.orgs),
+        )
+        results = await asyncio.gather(
+            *(self._fetch_org_models(client, org) for org in self.orgs),
+            self._fetch_trending(client),
+        )
+
+        for models in results:
+            for model in models:
                 model_id = model.get("id", "")
                 if not model_id or model_id in seen_ids:
                     continue
@@ -157,22 +181,14 @@ class HfModelsCollector(BaseCollector):
             content_parts.append(f"Likes: {likes}")
         if tags:
             # Show first few relevant tags
+            # 先做便宜的相等比较，前缀用切片比较，免去 startswith 方法调用
             relevant_tags = [
                 t for t in tags[:10]
-                if not t.startswith("arxiv:") and t != pipeline_tag
+                if t != pipeline_tag and t[:6] != "arxiv:"
             ]
             if relevant_tags:
                 content_parts.append(f"Tags: {', '.join(relevant_tags[:5])}")
 
-        published_at = None
-        if last_modified:
-            try:
-                published_at = datetime.fromisoformat(
-                    last_modified.replace("Z", "+00:00")
-                )
-            except ValueError:
-                pass
-
         return NewsItem(
             title=f"[HF Model] {model_id}",
             url=f"https://huggingface.co/{model_id}",
@@ -180,5 +196,5 @@ class HfModelsCollector(BaseCollector):
             source_name=org or "HuggingFace",
             content=" | ".join(content_parts),
             score=float(likes),
-            published_at=published_at,
+            published_at=parse_iso(last_modified),
         )
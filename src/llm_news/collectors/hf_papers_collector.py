@@ -7,21 +7,37 @@ API endpoint: https://huggingface.co/api/daily_papers
 """
 
 import logging
-from datetime import datetime, timezone
 
 import httpx
 
+from ..cache import cache_age, load_validated_json, save_validated_json, touch
 from ..models import NewsItem
+from ._keywords import compile_keywords, matches_keywords
+from ._time import parse_iso
 from .base import BaseCollector
 
 logger = logging.getLogger(__name__)
 
 HF_DAILY_PAPERS_API = "https://huggingface.co/api/daily_papers"
 
+# Daily Papers 约每天更新一次：1h 内的缓存直接使用，不发请求
+# Cached copy younger than this is used without any request
+_FRESH_SECONDS = 3600
 
-def _matches_keywords(text: str, keywords: list[str]) -> bool:
-    text_lower = text.lower()
-    return any(kw.lower() in text_lower for kw in keywords)
+
+def _slim_papers(papers: list[dict]) -> list[dict]:
+    """Keep only the fields we use (drops authors, media, comments, etc.).
+
+    解析后立即裁剪，缓存文件也随之变小。
+    """
+    slim = []
+    for paper in papers:
+        data = paper.get("paper", {})
+        slim.append({
+            "paper": {k: data[k] for k in ("id", "title", "summary", "upvotes") if k in data},
+            "publishedAt": paper.get("publishedAt", ""),
+        })
+    return slim
 
 
 class HfPapersCollector(BaseCollector):
@@ -32,17 +48,56 @@ class HfPapersCollector(BaseCollector):
 
     name = "hf_papers"
 
-    def __init__(self, limit: int = 30) -> None:
+    def __init__(self, limit: int = 30, http: httpx.AsyncClient | None = None) -> None:
         self.limit = limit
+        self.http = http
+
+    async def _fetch_papers(self, client: httpx.AsyncClient) -> list[dict]:
+        """Fetch daily papers, reusing the on-disk copy where possible.
+
+        - 缓存不足 _FRESH_SECONDS：直接使用，不发请求；
+        - 已过期：带 ETag 条件请求，304 时复用并刷新缓存时间；
+        - 请求失败但有旧缓存：返回旧数据（stale-if-error）。
+        """
+        cache_key = str(self.limit)
+        validated = load_validated_json("hf_papers", cache_key)
+        if validated:
+            age = cache_age("hf_papers", cache_key)
+            if age is not None and age < _FRESH_SECONDS:
+                logger.debug("HF Daily Papers cache fresh (%.0fs old)", age)
+                return validated[1]
+
+        try:
+            resp = await client.get(
+                HF_DAILY_PAPERS_API,
+                params={"limit": self.limit},
+                headers=validated[0] if validated else None,
+            )
+            if resp.status_code == 304 and validated:
+                logger.debug("HF Daily Papers not modified")
+                touch("hf_papers", cache_key)
+                return validated[1]
+            resp.raise_for_status()
+        except Exception:
+            if not validated:
+                raise
+            logger.warning("HF Daily Papers fetch failed, using cached copy", exc_info=True)
+            return validated[1]
+
+        papers = _slim_papers(resp.json())
+        save_validated_json("hf_papers", cache_key, resp.headers, papers)
+        return papers
 
     def collect(self, keywords: list[str]) -> list[NewsItem]:
+        return self.run_async(self.acollect(keywords))
+
+    async def acollect(self, keywords: list[str]) -> list[NewsItem]:
         items: list[NewsItem] = []
+        kw_pattern = compile_keywords(tuple(keywords))
 
         try:
-            with httpx.Client(timeout=30, follow_redirects=True) as client:
-                resp = client.get(HF_DAILY_PAPERS_API, params={"limit": self.limit})
-                resp.raise_for_status()
-                papers = resp.json()
+            client = self.http or self.get_http_client()
+            papers = await self._fetch_papers(client)
 
             for paper in papers:
                 paper_data = paper.get("paper", {})
@@ -54,21 +109,14 @@ class HfPapersCollector(BaseCollector):
                 if not title:
                     continue
 
-                if keywords:
+                if kw_pattern:
                     text_for_match = f"{title} {summary}"
-                    if not _matches_keywords(text_for_match, keywords):
+                    if not matches_keywords(text_for_match, kw_pattern):
                         continue
 
                 url = f"https://huggingface.co/papers/{arxiv_id}" if arxiv_id else ""
 
-                published_at = None
-                if published_str:
-                    try:
-                        published_at = datetime.fromisoformat(
-                            published_str.replace("Z", "+00:00")
-                        )
-                    except ValueError:
-                        pass
+                published_at = parse_iso(published_str)
 
                 upvotes = paper.get("paper", {}).get("upvotes", 0)
 
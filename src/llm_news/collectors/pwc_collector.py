@@ -6,22 +6,27 @@ Papers with Code API 免费，无需 API Key。
 API: https://paperswithcode.com/api/v1/papers/
 """
 
+import asyncio
 import logging
-from datetime import datetime, timezone
+from datetime import timezone
 
 import httpx
 
+from ..cache import load_items, save_items
 from ..models import NewsItem
+from ._keywords import compile_keywords, matches_keywords
+from ._time import parse_iso
 from .base import BaseCollector
 
 logger = logging.getLogger(__name__)
 
 PWC_API = "https://paperswithcode.com/api/v1/papers/"
 
+# 短时间内重跑不重复请求 PwC / Reuse results when re-running within 10 minutes
+_CACHE_TTL = 600
 
-def _matches_keywords(text: str, keywords: list[str]) -> bool:
-    text_lower = text.lower()
-    return any(kw.lower() in text_lower for kw in keywords)
+# 单页条数 / Page size per request when limit spans several pages
+_PAGE_SIZE = 50
 
 
 class PwcCollector(BaseCollector):
@@ -33,97 +38,110 @@ class PwcCollector(BaseCollector):
 
     name = "pwc"
 
-    def __init__(self, limit: int = 50) -> None:
+    def __init__(self, limit: int = 50, http: httpx.AsyncClient | None = None) -> None:
         self.limit = limit
+        self.http = http
+
+    @staticmethod
+    async def _fetch_page(
+        client: httpx.AsyncClient, page: int, per_page: int,
+    ) -> list[dict]:
+        resp = await client.get(
+            PWC_API,
+            params={
+                "ordering": "-published",
+                "items_per_page": per_page,
+                "page": page,
+            },
+            headers={"Accept": "application/json"},
+            follow_redirects=False,  # PwC API may redirect to HF; stay on PwC
+        )
+        resp.raise_for_status()
+        return resp.json().get("results", [])
 
     def collect(self, keywords: list[str]) -> list[NewsItem]:
+        return self.run_async(self.acollect(keywords))
+
+    async def acollect(self, keywords: list[str]) -> list[NewsItem]:
+        cache_key = f"{self.limit}|{','.join(keywords)}"
+        cached = load_items("pwc", cache_key, _CACHE_TTL)
+        if cached is not None:
+            logger.info("Papers with Code: cache hit, reusing %d papers", len(cached))
+            return cached
+
         items: list[NewsItem] = []
+        kw_pattern = compile_keywords(tuple(keywords))
 
         try:
-            with httpx.Client(
-                timeout=30,
-                follow_redirects=False,  # PwC API may redirect to HF; stay on PwC
-                headers={"Accept": "application/json"},
-            ) as client:
-                # Fetch latest papers, sorted by date
-                # 获取最新论文，按日期排序
-                resp = client.get(
-                    PWC_API,
-                    params={
-                        "ordering": "-published",
-                        "items_per_page": self.limit,
-                    },
+            client = self.http or self.get_http_client()
+            # Fetch latest papers, sorted by date; pages fetched concurrently
+            # 获取最新论文，按日期排序；limit 超过单页大小时并发拉取各页
+            per_page = min(self.limit, _PAGE_SIZE)
+            pages = -(-self.limit // _PAGE_SIZE)
+            pages_results = await asyncio.gather(*(
+                self._fetch_page(client, page, per_page)
+                for page in range(1, pages + 1)
+            ))
+            results = [p for page in pages_results for p in page][:self.limit]
+            logger.info("Papers with Code: fetched %d papers", len(results))
+
+            for paper in results:
+                title = paper.get("title", "").strip()
+                abstract = paper.get("abstract", "").strip()
+                paper_url = paper.get("url_abs", "") or paper.get("paper_url", "")
+                arxiv_id = paper.get("arxiv_id", "")
+                published = paper.get("published", "")
+                authors = paper.get("authors", [])
+
+                if not title:
+                    continue
+
+                # Keyword filter / 关键词过滤
+                text_for_match = f"{title} {abstract}"
+                if kw_pattern and not matches_keywords(text_for_match, kw_pattern):
+                    continue
+
+                # Build URL: prefer arxiv link / 优先使用 arXiv 链接
+                if arxiv_id and not paper_url:
+                    paper_url = f"https://arxiv.org/abs/{arxiv_id}"
+
+                # PwC page URL
+                pwc_url = paper.get("url", "")
+                if pwc_url and not pwc_url.startswith("http"):
+                    pwc_url = f"https://paperswithcode.com{pwc_url}"
+
+                # Build content with author info / 构建含作者信息的内容
+                content_parts = []
+                if authors:
+                    author_names = authors[:3]
+                    author_str = ", ".join(author_names)
+                    if len(authors) > 3:
+                        author_str += " et al."
+                    content_parts.append(f"[Authors: {author_str}]")
+                if abstract:
+                    content_parts.append(abstract[:500])
+                if pwc_url:
+                    content_parts.append(f"[PwC: {pwc_url}]")
+
+                # fromisoformat 已支持 "YYYY-MM-DD"，无需 strptime 兜底
+                published_at = parse_iso(published)
+                if published_at is not None:
+                    published_at = published_at.replace(tzinfo=timezone.utc)
+
+                item = NewsItem(
+                    title=f"[PwC] {title}",
+                    url=paper_url or pwc_url,
+                    source="pwc",
+                    source_name="Papers with Code",
+                    content=" ".join(content_parts),
+                    published_at=published_at,
                 )
-                resp.raise_for_status()
-                data = resp.json()
-
-                results = data.get("results", [])
-                logger.info("Papers with Code: fetched %d papers", len(results))
-
-                for paper in results:
-                    title = paper.get("title", "").strip()
-                    abstract = paper.get("abstract", "").strip()
-                    paper_url = paper.get("url_abs", "") or paper.get("paper_url", "")
-                    arxiv_id = paper.get("arxiv_id", "")
-                    published = paper.get("published", "")
-                    authors = paper.get("authors", [])
-
-                    if not title:
-                        continue
-
-                    # Keyword filter / 关键词过滤
-                    text_for_match = f"{title} {abstract}"
-                    if keywords and not _matches_keywords(text_for_match, keywords):
-                        continue
-
-                    # Build URL: prefer arxiv link / 优先使用 arXiv 链接
-                    if arxiv_id and not paper_url:
-                        paper_url = f"https://arxiv.org/abs/{arxiv_id}"
-
-                    # PwC page URL
-                    pwc_url = paper.get("url", "")
-                    if pwc_url and not pwc_url.startswith("http"):
-                        pwc_url = f"https://paperswithcode.com{pwc_url}"
-
-                    # Build content with author info / 构建含作者信息的内容
-                    content_parts = []
-                    if authors:
-                        author_names = authors[:3]
-                        author_str = ", ".join(author_names)
-                        if len(authors) > 3:
-                            author_str += " et al."
-                        content_parts.append(f"[Authors: {author_str}]")
-                    if abstract:
-                        content_parts.append(abstract[:500])
-                    if pwc_url:
-                        content_parts.append(f"[PwC: {pwc_url}]")
-
-                    published_at = None
-                    if published:
-                        try:
-                            published_at = datetime.fromisoformat(published).replace(
-                                tzinfo=timezone.utc
-                            )
-                        except ValueError:
-                            try:
-                                published_at = datetime.strptime(
-                                    published, "%Y-%m-%d"
-                                ).replace(tzinfo=timezone.utc)
-                            except ValueError:
-                                pass
-
-                    item = NewsItem(
-                        title=f"[PwC] {title}",
-                        url=paper_url or pwc_url,
-                        source="pwc",
-                        source_name="Papers with Code",
-                        content=" ".join(content_parts),
-                        published_at=published_at,
-                    )
-                    items.append(item)
+                items.append(item)
 
         except Exception:
             logger.exception("Failed to fetch Papers with Code")
+        else:
+            save_items("pwc", cache_key, items)
 
         logger.info("Papers with Code: collected %d papers", len(items))
         return items
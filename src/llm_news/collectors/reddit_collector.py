@@ -2,25 +2,24 @@
 
 Fetches hot/top posts from LLM-related subreddits.
 Reddit API 免费 100 QPM。
+各子版块在线程池中并发拉取，单个子版块失败不影响其他子版块。
 """
 
 import logging
-from datetime import datetime, timezone
+import re
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any
 
 import praw
-from praw.exceptions import PRAWException
 
 from ..models import NewsItem
+from ._keywords import compile_keywords, matches_keywords
+from ._time import from_epoch
 from .base import BaseCollector
 
 logger = logging.getLogger(__name__)
 
 
-def _matches_keywords(text: str, keywords: list[str]) -> bool:
-    text_lower = text.lower()
-    return any(kw.lower() in text_lower for kw in keywords)
-
-
 class RedditCollector(BaseCollector):
     """Reddit collector (community signal source).
 
@@ -43,69 +42,88 @@ class RedditCollector(BaseCollector):
         self.time_filter = time_filter
         self.limit = limit
 
+    def _new_reddit(self) -> praw.Reddit:
+        return praw.Reddit(
+            client_id=self.client_id,
+            client_secret=self.client_secret,
+            user_agent="llm-news/0.1.0",
+        )
+
+    def _post_to_item(
+        self, post: Any, kw_pattern: re.Pattern[str] | None,
+    ) -> NewsItem | None:
+        """Convert one submission to a NewsItem (None if filtered out by keywords)."""
+        title = post.title or ""
+        selftext = post.selftext or ""
+        url = post.url or ""
+        permalink = f"https://www.reddit.com{post.permalink}"
+
+        text_for_match = f"{title} {selftext}"
+        if kw_pattern and not matches_keywords(text_for_match, kw_pattern):
+            return None
+
+        published_at = None
+        if post.created_utc:
+            published_at = from_epoch(post.created_utc)
+
+        content = selftext[:500] if selftext else ""
+        if (
+            url
+            and url != permalink
+            and not url.startswith("https://www.reddit.com")
+        ):
+            content = f"[Link: {url}] {content}"
+
+        return NewsItem(
+            title=title,
+            url=permalink,
+            source="reddit",
+            source_name=f"r/{post.subreddit.display_name}",
+            content=content,
+            score=float(post.score),
+            published_at=published_at,
+        )
+
+    def _fetch_sub(
+        self, sub_name: str, kw_pattern: re.Pattern[str] | None,
+    ) -> list[NewsItem]:
+        """Fetch top posts of one subreddit, filtered by keywords.
+
+        PRAW 实例不是线程安全的，每个线程各自创建一个。
+        """
+        logger.info(
+            "Fetching Reddit: r/%s (top/%s, limit=%d)",
+            sub_name, self.time_filter, self.limit,
+        )
+        subreddit = self._new_reddit().subreddit(sub_name)
+        items: list[NewsItem] = []
+        for post in subreddit.top(time_filter=self.time_filter, limit=self.limit):
+            item = self._post_to_item(post, kw_pattern)
+            if item is not None:
+                items.append(item)
+        return items
+
     def collect(self, keywords: list[str]) -> list[NewsItem]:
         if not self.client_id or not self.client_secret:
             logger.warning("Reddit credentials not configured, skipping")
             return []
 
         items: list[NewsItem] = []
-
-        try:
-            reddit = praw.Reddit(
-                client_id=self.client_id,
-                client_secret=self.client_secret,
-                user_agent="llm-news/0.1.0",
-            )
-
-            for sub_name in self.subreddits:
-                logger.info(
-                    "Fetching Reddit: r/%s (top/%s, limit=%d)",
-                    sub_name, self.time_filter, self.limit,
-                )
+        kw_pattern = compile_keywords(tuple(keywords))
+
+        # 各子版块独立拉取（每个子版块各取 limit 条，小版块不被大版块挤占），
+        # 并发执行，结果按配置顺序合并；私有 / 封禁 / 拼错的子版块只影响自身
+        # Fetch subreddits concurrently, merge in configured order
+        with ThreadPoolExecutor(max_workers=len(self.subreddits) or 1) as executor:
+            futures = [
+                executor.submit(self._fetch_sub, sub_name, kw_pattern)
+                for sub_name in self.subreddits
+            ]
+            for sub_name, future in zip(self.subreddits, futures):
                 try:
-                    subreddit = reddit.subreddit(sub_name)
-                    for post in subreddit.top(
-                        time_filter=self.time_filter, limit=self.limit
-                    ):
-                        title = post.title or ""
-                        selftext = post.selftext or ""
-                        url = post.url or ""
-                        permalink = f"https://www.reddit.com{post.permalink}"
-
-                        text_for_match = f"{title} {selftext}"
-                        if keywords and not _matches_keywords(text_for_match, keywords):
-                            continue
-
-                        published_at = None
-                        if post.created_utc:
-                            published_at = datetime.fromtimestamp(
-                                post.created_utc, tz=timezone.utc
-                            )
-
-                        content = selftext[:500] if selftext else ""
-                        if (
-                            url
-                            and url != permalink
-                            and not url.startswith("https://www.reddit.com")
-                        ):
-                            content = f"[Link: {url}] {content}"
-
-                        item = NewsItem(
-                            title=title,
-                            url=permalink,
-                            source="reddit",
-                            source_name=f"r/{sub_name}",
-                            content=content,
-                            score=float(post.score),
-                            published_at=published_at,
-                        )
-                        items.append(item)
-
-                except PRAWException:
+                    items.extend(future.result())
+                except Exception:
                     logger.exception("Failed to fetch r/%s", sub_name)
 
-        except Exception:
-            logger.exception("Failed to initialize Reddit client")
-
         logger.info("Reddit: collected %d posts", len(items))
         return items
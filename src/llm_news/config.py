@@ -6,6 +6,13 @@ import yaml
 from pydantic import BaseModel
 from pydantic_settings import BaseSettings
 
+# libyaml C 解析器约快 10 倍；未编译 libyaml 时回退纯 Python 实现
+# Prefer the libyaml-backed loader, fall back to the pure-Python one
+try:
+    from yaml import CSafeLoader as _SafeLoader
+except ImportError:  # pragma: no cover - PyYAML built without libyaml
+    from yaml import SafeLoader as _SafeLoader
+
 
 # ---------------------------------------------------------------------------
 # Config sub-models (loaded from config.yaml)
@@ -16,6 +23,7 @@ class ArxivConfig(BaseModel):
     categories: list[str] = ["cs.CL", "cs.AI", "cs.LG"]
     max_results: int = 50
     require_institution: bool = True  # 仅保留知名大学/公司的论文
+    use_oai: bool = False  # 使用 OAI-PMH 增量收割代替搜索 API
 
 
 class BlogSource(BaseModel):
@@ -96,6 +104,10 @@ class LlmConfig(BaseModel):
     base_url: str = "https://openrouter.ai/api/v1"
     top_n: int = 10
     max_retries: int = 5  # OpenAI client 重试次数（应对 429 限流）
+    batch_size: int = 40  # Step 1 每批新闻条数（分批请求，避免单次响应过长被截断）
+    max_concurrency: int = 4  # Step 1 并发请求批数（免费模型注意 RPM 限制）
+    # Step 1 使用 json_schema 约束输出（需模型/provider 支持；不支持时仍走文本提取）
+    structured_output: bool = False
 
 
 class TtsConfig(BaseModel):
@@ -152,8 +164,8 @@ def load_config(config_path: str = "config.yaml") -> tuple[AppConfig, Settings]:
     """Load app config from YAML and secrets from .env."""
     path = Path(config_path)
     if path.exists():
-        with open(path) as f:
-            data = yaml.safe_load(f) or {}
+        with open(path, "rb") as f:
+            data = yaml.load(f, Loader=_SafeLoader) or {}
         app_config = AppConfig(**data)
     else:
         app_config = AppConfig()
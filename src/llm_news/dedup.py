@@ -4,16 +4,21 @@
 1. URL 标准化（去尾斜杠、统一协议、去 www、去追踪参数）
 2. 跨源规范 ID 提取（arxiv / HF Papers 论文 ID 统一）
 3. 标准化 URL 去重
-4. 标题精确匹配（标准化后，兜底层）
+4. 标题匹配（标准化后精确匹配，或长标题前缀相同且词集高度重合，兜底层）
 5. 来源优先级选择（重复时保留原始数据源头）
 """
 
+import contextlib
+import functools
 import json
 import logging
+import os
 import re
+import tempfile
+from collections.abc import Collection, Iterable, Mapping
 from datetime import datetime, timezone
 from pathlib import Path
-from urllib.parse import parse_qs, urlencode, urlparse, urlunparse
+from urllib.parse import parse_qs, urlencode, urlparse
 
 from .models import NewsItem
 
@@ -45,64 +50,124 @@ _TRACKING_PARAMS = frozenset({
     "ref", "source", "fbclid", "gclid", "mc_cid", "mc_eid",
 })
 
+# Query that survives the parse_qs / urlencode round-trip unchanged:
+# every pair is "key=value" made of unreserved characters, no empty pairs
+# 经 parse_qs / urlencode 往返后不变的 query：每段均为仅含非保留字符的 key=value，无空段
+_PLAIN_QUERY_RE = re.compile(r"[\w.~-]+=[\w.~-]*(?:&[\w.~-]+=[\w.~-]*)*", re.ASCII)
 
+
+def _canonical_query(query: str) -> str:
+    """Strip tracking params and canonicalize the query string.
+
+    去追踪参数并规范化 query；无追踪参数、无重复 key 的纯 key=value 形式原样返回，
+    其余（空段、"+"/"%" 编码、无 "=" 等）走 parse_qs / urlencode 往返，结果一致。
+    """
+    if _PLAIN_QUERY_RE.fullmatch(query):
+        lowered = query.lower()
+        if not any(param in lowered for param in _TRACKING_PARAMS):
+            keys = [pair.partition("=")[0] for pair in query.split("&")]
+            if len(set(keys)) == len(keys):
+                return query
+    params = parse_qs(query, keep_blank_values=True)
+    filtered = {k: v for k, v in params.items() if k.lower() not in _TRACKING_PARAMS}
+    return urlencode(filtered, doseq=True) if filtered else ""
+
+
+def _split_url(url: str) -> tuple[str, int | None, str, str] | None:
+    """Split a plain "scheme://host[:port]/path?query#frag" URL with str.find.
+
+    返回 (小写 host, port, path, query)；含 userinfo / IPv6 / 非法端口等少见形式时
+    返回 None，由 urlparse 兜底。path 的 ";params" 与 urlparse 一致地丢弃。
+    """
+    sep = url.find("://")
+    if sep <= 0 or not (url[:sep].isascii() and url[:sep].isalpha()):
+        return None
+    start = sep + 3
+    end = len(url)
+    for ch in "/?#":
+        i = url.find(ch, start, end)
+        if i != -1:
+            end = i
+    authority = url[start:end]
+    if "@" in authority or "[" in authority:
+        return None
+
+    path, _, query = url[end:].partition("#")[0].partition("?")
+    if ";" in path:
+        i = path.find(";", path.rfind("/"))
+        if i != -1:
+            path = path[:i]
+
+    host, _, port_str = authority.partition(":")
+    port = None
+    if port_str:
+        if not (port_str.isascii() and port_str.isdigit()) or int(port_str) > 65535:
+            return None
+        port = int(port_str)
+    return host.lower(), port, path, query
+
+
+# 纯函数，按字符串缓存：同一 URL / 标题在多个来源、历史记录中重复出现
+# Pure str -> str helpers; memoized since the same URL/title recurs across sources
+_NORMALIZE_CACHE_SIZE = 32768
+
+
+@functools.lru_cache(maxsize=_NORMALIZE_CACHE_SIZE)
 def normalize_url(url: str) -> str:
     """Normalize URL for comparison.
 
     标准化 URL：统一协议、去 www、去尾斜杠、去追踪参数、去 fragment。
+    常见 URL 走 str.find 切分的快路径，其余交给 urlparse。
     """
     url = url.strip()
     if not url:
         return url
 
-    parsed = urlparse(url)
-
-    # Normalize scheme to https / 统一 https
-    scheme = "https"
+    split = _split_url(url)
+    if split is None:
+        parsed = urlparse(url)
+        host = (parsed.hostname or "").lower()
+        port = parsed.port
+        path, query = parsed.path, parsed.query
+    else:
+        host, port, path, query = split
 
-    # Normalize host: lowercase + remove www / 去 www
-    host = (parsed.hostname or "").lower()
+    # Normalize host: remove www / 去 www
     if host.startswith("www."):
         host = host[4:]
 
     # Keep non-standard port / 保留非标端口
-    port = parsed.port
     netloc = host
     if port and port not in (80, 443):
         netloc = f"{host}:{port}"
 
     # Remove trailing slash / 去尾斜杠
-    path = parsed.path.rstrip("/")
+    path = path.rstrip("/")
+    if path and path[0] != "/":
+        path = "/" + path
 
     # Strip tracking query params / 去追踪参数
-    if parsed.query:
-        params = parse_qs(parsed.query, keep_blank_values=True)
-        filtered = {
-            k: v for k, v in params.items()
-            if k.lower() not in _TRACKING_PARAMS
-        }
-        query = urlencode(filtered, doseq=True) if filtered else ""
-    else:
-        query = ""
+    if query:
+        query = _canonical_query(query)
 
-    # Drop fragment / 去 fragment
-    return urlunparse((scheme, netloc, path, "", query, ""))
+    # Normalize scheme to https, drop fragment / 统一 https，去 fragment
+    # （无 host 且 path 以 "//" 开头时与 urlunparse 一致，不再补 "//"）
+    base = f"https://{netloc}{path}" if netloc or path[:2] != "//" else f"https:{path}"
+    return f"{base}?{query}" if query else base
 
 
 # ── Canonical Key Extraction / 规范 ID 提取 ──────────────────────────────
 # Extract a cross-source canonical key for the same underlying content.
 # 提取跨源规范 key，使不同来源的同一内容映射到同一标识。
 
-# Regex patterns to extract arxiv paper ID from various URL formats
-# 从不同 URL 格式提取 arxiv 论文 ID
-_ARXIV_ID_PATTERNS: list[re.Pattern[str]] = [
-    # http://arxiv.org/abs/2602.06570v1 → 2602.06570
-    re.compile(r"arxiv\.org/abs/(\d{4}\.\d{4,5})"),
-    # http://arxiv.org/pdf/2602.06570v1.pdf → 2602.06570
-    re.compile(r"arxiv\.org/pdf/(\d{4}\.\d{4,5})"),
-    # https://huggingface.co/papers/2602.06570 → 2602.06570
-    re.compile(r"huggingface\.co/papers/(\d{4}\.\d{4,5})"),
-]
+# Regex to extract arxiv paper ID from various URL formats (one alternation, single scan)
+# 从不同 URL 格式提取 arxiv 论文 ID（合并为单个正则，一次扫描）
+#   http://arxiv.org/abs/2602.06570v1 → 2602.06570
+#   http://arxiv.org/pdf/2602.06570v1.pdf → 2602.06570
+#   https://huggingface.co/papers/2602.06570 → 2602.06570
+_ARXIV_ID_RE = re.compile(
+    r"(?:arxiv\.org/(?:abs|pdf)|huggingface\.co/papers)/(\d{4}\.\d{4,5})"
+)
 
 
 def extract_canonical_key(item: NewsItem) -> str | None:
@@ -113,11 +178,15 @@ def extract_canonical_key(item: NewsItem) -> str | None:
     """
     url = item.url
 
+    # 大多数 URL 与论文无关，先用子串判断跳过正则
+    # Cheap substring pre-check: most URLs are not paper links
+    if "arxiv.org/" not in url and "huggingface.co/papers/" not in url:
+        return None
+
     # Check arxiv-related patterns / 检查 arxiv 相关 URL
-    for pattern in _ARXIV_ID_PATTERNS:
-        match = pattern.search(url)
-        if match:
-            return f"arxiv:{match.group(1)}"
+    match = _ARXIV_ID_RE.search(url)
+    if match:
+        return f"arxiv:{match.group(1)}"
 
     return None
 
@@ -128,36 +197,97 @@ def extract_canonical_key(item: NewsItem) -> str | None:
 # 标题最短长度，避免太短的通用标题误匹配
 _MIN_TITLE_LENGTH = 15
 
+# Near-duplicate titles: same normalized prefix and token-set Jaccard >= threshold
+# 近似标题：标准化后前缀相同，且词集 Jaccard 相似度不低于阈值（如 HN / Reddit 转发加后缀）
+_TITLE_PREFIX_LENGTH = 40
+_TITLE_SIMILARITY = 0.85
+# 差异词为版本号 / 数字或版本标记时不视为近似（如 "release 0.6.1" vs "0.6.2"）
+_VERSION_WORDS = frozenset({"alpha", "beta", "rc", "preview", "nightly"})
+
+_NON_WORD_RE = re.compile(r"[^\w\s]")
+# bytes.translate 表：ASCII 中被 _NON_WORD_RE 匹配的字符（标点、控制符）→ 空格
+_ASCII_NON_WORD_TO_SPACE = bytes(
+    0x20 if i < 128 and _NON_WORD_RE.match(chr(i)) else i for i in range(256)
+)
 
+
+@functools.lru_cache(maxsize=_NORMALIZE_CACHE_SIZE)
 def normalize_title(title: str) -> str:
     """Normalize title for fuzzy matching.
 
     标题标准化：小写、去标点、合并空格。
     """
-    title = title.lower().strip()
+    title = title.lower()
     # Remove punctuation, keep alphanumeric and spaces / 去标点，保留字母数字和空格
-    title = re.sub(r"[^\w\s]", " ", title)
-    # Collapse whitespace / 合并空格
-    title = re.sub(r"\s+", " ", title).strip()
-    return title
+    # 纯 ASCII 标题用 bytes.translate 查表，含非 ASCII 字符（中文标点等）时走正则
+    if title.isascii():
+        title = title.encode("ascii").translate(_ASCII_NON_WORD_TO_SPACE).decode("ascii")
+    else:
+        title = _NON_WORD_RE.sub(" ", title)
+    # Collapse whitespace / 合并空格（str.split() 同时去首尾空白）
+    return " ".join(title.split())
+
+
+def _title_identity(norm_url: str, canon_key: str | None) -> str | None:
+    """Return a strong identity (paper ID / GitHub release URL) that near-duplicate
+    title matching must not override.
+
+    已有明确身份（不同 arxiv ID、不同 GitHub release）的条目不做近似标题合并。
+    """
+    if canon_key:
+        return canon_key
+    if "github.com/" in norm_url and "/releases/" in norm_url:
+        return norm_url
+    return None
+
+
+def _is_version_like(token: str) -> bool:
+    return token in _VERSION_WORDS or any(c.isdigit() for c in token)
+
+
+def _find_similar_title(
+    norm_title: str,
+    identity: str | None,
+    prefix_index: dict[str, list[tuple[int, frozenset[str], str | None]]],
+) -> int | None:
+    """Return the index of a registered title sharing the prefix with Jaccard >= threshold.
+
+    差异词含数字 / 版本标记，或双方身份（identity）不同时不匹配。
+    """
+    if len(norm_title) < _TITLE_PREFIX_LENGTH:
+        return None
+    bucket = prefix_index.get(norm_title[:_TITLE_PREFIX_LENGTH])
+    if not bucket:
+        return None
+    tokens = frozenset(norm_title.split())
+    for idx, other, other_identity in bucket:
+        if identity and other_identity and identity != other_identity:
+            continue
+        if len(tokens & other) < _TITLE_SIMILARITY * len(tokens | other):
+            continue
+        if any(_is_version_like(t) for t in tokens ^ other):
+            continue
+        return idx
+    return None
 
 
 # ── History Persistence / 历史记录持久化 ──────────────────────────────────
 
 
-def load_history() -> dict[str, set[str]]:
+def load_history() -> dict[str, dict[str, None]]:
     """Load previously seen identifiers from history file.
 
     加载历史记录，包含 urls 和 canonical_keys 两个集合。
-    Returns dict with 'urls' and 'canonical_keys' sets.
+    Returns dict with 'urls' and 'canonical_keys', each an insertion-ordered
+    dict used as an ordered set (oldest first).
     """
-    empty: dict[str, set[str]] = {"urls": set(), "canonical_keys": set()}
+    empty: dict[str, dict[str, None]] = {"urls": {}, "canonical_keys": {}}
     if not HISTORY_PATH.exists():
         return empty
     try:
         data = json.loads(HISTORY_PATH.read_text(encoding="utf-8"))
-        urls = set(data.get("urls", []))
-        canonical_keys = set(data.get("canonical_keys", []))
+        urls = dict.fromkeys(data.get("urls", []))
+        canonical_keys = dict.fromkeys(data.get("canonical_keys", []))
         logger.info(
             "Loaded history: %d URLs, %d canonical keys",
             len(urls), len(canonical_keys),
@@ -168,20 +298,16 @@ def load_history() -> dict[str, set[str]]:
         return empty
 
 
-def save_history(history: dict[str, set[str]]) -> None:
+def save_history(history: Mapping[str, Iterable[str]]) -> None:
     """Save seen identifiers to history file.
 
     保存历史记录（URLs + canonical keys），最多 10,000 条 URL。
+    按插入顺序保存（旧 → 新），超出上限时丢弃最早的条目。
     """
     HISTORY_PATH.parent.mkdir(parents=True, exist_ok=True)
 
-    url_list = sorted(history.get("urls", set()))
-    if len(url_list) > 10_000:
-        url_list = url_list[-10_000:]
-
-    canon_list = sorted(history.get("canonical_keys", set()))
-    if len(canon_list) > 5_000:
-        canon_list = canon_list[-5_000:]
+    url_list = list(history.get("urls", ()))[-10_000:]
+    canon_list = list(history.get("canonical_keys", ()))[-5_000:]
 
     data = {
         "updated_at": datetime.now(timezone.utc).isoformat(),
@@ -189,10 +315,23 @@ def save_history(history: dict[str, set[str]]) -> None:
         "urls": url_list,
         "canonical_keys": canon_list,
     }
-    HISTORY_PATH.write_text(
-        json.dumps(data, indent=2, ensure_ascii=False),
-        encoding="utf-8",
+    # Compact output: indent forces json's pure-Python encoder (C encoder ~40% faster)
+    # 不缩进：indent 会退回纯 Python 编码器，紧凑格式可走 C 编码器
+    text = json.dumps(data, ensure_ascii=False, separators=(",", ":"))
+
+    # 先写同目录临时文件再 os.replace 原子替换，中途失败不会留下半截的 history
+    # Write to a temp file in the same directory, then atomically replace
+    fd, tmp_path = tempfile.mkstemp(
+        dir=HISTORY_PATH.parent, prefix=".history-", suffix=".tmp",
     )
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            f.write(text)
+        os.replace(tmp_path, HISTORY_PATH)
+    except BaseException:
+        with contextlib.suppress(OSError):
+            os.unlink(tmp_path)
+        raise
     logger.info(
         "Saved history: %d URLs, %d canonical keys",
         len(url_list), len(canon_list),
@@ -216,26 +355,28 @@ def _pick_preferred(existing: NewsItem, new: NewsItem) -> NewsItem:
     return existing
 
 
-def deduplicate(items: list[NewsItem], history: dict[str, set[str]]) -> list[NewsItem]:
+def deduplicate(
+    items: list[NewsItem], history: Mapping[str, Collection[str]],
+) -> list[NewsItem]:
     """Remove duplicate items using multi-layer strategy.
 
     多层去重策略（按优先级依次检查）：
     Layer 0: 历史 URL / canonical key 过滤（跨天去重）
     Layer 1: 规范 ID 去重（arxiv 论文 ID 等跨源匹配）
     Layer 2: 标准化 URL 去重（去尾斜杠、统一协议等）
-    Layer 3: 标题精确匹配去重（标准化后，兜底层）
+    Layer 3: 标题去重（标准化后精确匹配；长标题前缀相同且词集 Jaccard ≥ 0.85 也算，兜底层）
 
     重复时按 SOURCE_PRIORITY 保留最接近原始来源的条目。
 
     Args:
         items: Collected news items from all sources.
-        history: Dict with 'urls' and 'canonical_keys' sets.
+        history: Mapping with 'urls' and 'canonical_keys' collections.
 
     Returns:
         Deduplicated list of items.
     """
-    history_urls = history.get("urls", set())
-    history_canon = history.get("canonical_keys", set())
+    history_urls = history.get("urls", ())
+    history_canon = history.get("canonical_keys", ())
 
     # Pre-compute normalized history URLs for broader matching
     # 预计算标准化历史 URL，用于更宽泛的匹配
@@ -246,16 +387,21 @@ def deduplicate(items: list[NewsItem], history: dict[str, set[str]]) -> list[New
     canonical_index: dict[str, int] = {}   # canonical_key → idx
     norm_url_index: dict[str, int] = {}    # normalized_url → idx
     title_index: dict[str, int] = {}       # normalized_title → idx
+    # title prefix → [(idx, token set, identity)] / 标题前缀 → [(索引, 词集, 身份)]
+    title_prefix_index: dict[str, list[tuple[int, frozenset[str], str | None]]] = {}
 
     result: list[NewsItem] = []
 
     stats = {"history": 0, "canonical": 0, "url": 0, "title": 0}
 
-    for item in items:
-        norm_url = normalize_url(item.url)
-        canon_key = extract_canonical_key(item)
-        norm_title = normalize_title(item.title)
+    # 先批量计算各条目的去重 key，再执行逐层去重
+    # Compute every item's dedup keys in one pass, then run the layers over them
+    keys = [
+        (normalize_url(item.url), extract_canonical_key(item), normalize_title(item.title))
+        for item in items
+    ]
 
+    for item, (norm_url, canon_key, norm_title) in zip(items, keys):
         # ── Layer 0: History filter / 历史过滤 ──
         if item.url in history_urls or norm_url in normalized_history_urls:
             stats["history"] += 1
@@ -309,12 +455,17 @@ def deduplicate(items: list[NewsItem], history: dict[str, set[str]]) -> list[New
 
         # ── Layer 3: Title dedup / 标题去重 ──
         # Safety net for same content with completely different URLs
-        if (
-            norm_title
-            and len(norm_title) >= _MIN_TITLE_LENGTH
-            and norm_title in title_index
-        ):
-            idx = title_index[norm_title]
+        match_idx = None
+        similar = False
+        if norm_title and len(norm_title) >= _MIN_TITLE_LENGTH:
+            match_idx = title_index.get(norm_title)
+            if match_idx is None:
+                similar = True
+                match_idx = _find_similar_title(
+                    norm_title, _title_identity(norm_url, canon_key), title_prefix_index,
+                )
+        if match_idx is not None:
+            idx = match_idx
             existing = result[idx]
             preferred = _pick_preferred(existing, item)
             if preferred is not existing:
@@ -322,12 +473,21 @@ def deduplicate(items: list[NewsItem], history: dict[str, set[str]]) -> list[New
                 norm_url_index[norm_url] = idx
                 if canon_key:
                     canonical_index[canon_key] = idx
-            logger.debug(
-                "Title dedup: '%s' (%s) ≈ '%s' (%s) → kept %s",
-                item.title[:50], item.source,
-                existing.title[:50], existing.source,
-                (preferred.source),
-            )
+            if similar:
+                # 近似标题合并不可逆，info 级别记录完整标题便于排查误合并
+                logger.info(
+                    "Near-duplicate title merge: '%s' (%s) ≈ '%s' (%s) → kept %s",
+                    item.title, item.source,
+                    existing.title, existing.source,
+                    preferred.source,
+                )
+            else:
+                logger.debug(
+                    "Title dedup: '%s' (%s) ≈ '%s' (%s) → kept %s",
+                    item.title[:50], item.source,
+                    existing.title[:50], existing.source,
+                    (preferred.source),
+                )
             stats["title"] += 1
             continue
 
@@ -340,6 +500,12 @@ def deduplicate(items: list[NewsItem], history: dict[str, set[str]]) -> list[New
         norm_url_index[norm_url] = idx
         if norm_title and len(norm_title) >= _MIN_TITLE_LENGTH:
             title_index[norm_title] = idx
+            if len(norm_title) >= _TITLE_PREFIX_LENGTH:
+                title_prefix_index.setdefault(
+                    norm_title[:_TITLE_PREFIX_LENGTH], [],
+                ).append((
+                    idx, frozenset(norm_title.split()), _title_identity(norm_url, canon_key),
+                ))
 
     removed_total = stats["history"] + stats["canonical"] + stats["url"] + stats["title"]
     logger.info(
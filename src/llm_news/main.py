@@ -4,11 +4,11 @@ Orchestrates the full pipeline:
   1. Load config → 2. Collect → 3. Dedup → 4. LLM process → 5. TTS → 6. Output
 """
 
+import asyncio
 import logging
 import sys
-from concurrent.futures import ThreadPoolExecutor, as_completed
 
-from .collectors import REGISTRY, BaseCollector
+from .collectors import BaseCollector, get_collector
 from .config import AppConfig, Settings, load_config
 from .dedup import deduplicate, extract_canonical_key, load_history, save_history
 from .models import NewsItem
@@ -48,6 +48,7 @@ def _build_collectors(config: AppConfig, settings: Settings) -> list[BaseCollect
                 "categories": src.arxiv.categories,
                 "max_results": src.arxiv.max_results,
                 "require_institution": src.arxiv.require_institution,
+                "use_oai": src.arxiv.use_oai,
             },
         },
         "blog": {
@@ -116,8 +117,9 @@ def _build_collectors(config: AppConfig, settings: Settings) -> list[BaseCollect
             logger.info("Collector %s is disabled, skipping", name)
             continue
 
-        cls = REGISTRY.get(name)
-        if cls is None:
+        try:
+            cls = get_collector(name)
+        except KeyError:
             logger.warning("Unknown collector: %s (not in registry)", name)
             continue
 
@@ -132,32 +134,34 @@ def _build_collectors(config: AppConfig, settings: Settings) -> list[BaseCollect
 
 
 def _collect_all(config: AppConfig, settings: Settings) -> list[NewsItem]:
-    """Run all collectors in parallel threads.
+    """Run all collectors concurrently on the shared event loop.
 
     Each collector is independent; failures are isolated.
+    异步 collector 直接在共享事件循环上并发执行，同步 collector（arXiv、Reddit）
+    通过 acollect 的默认实现放到线程中，全部用一次 asyncio.gather 调度。
     """
-    all_items: list[NewsItem] = []
     keywords = config.keywords
 
     collectors = _build_collectors(config, settings)
     if not collectors:
         logger.warning("No collectors enabled")
-        return all_items
+        return []
 
     logger.info("Running %d collectors in parallel...", len(collectors))
 
-    with ThreadPoolExecutor(max_workers=5) as executor:
-        futures = {
-            executor.submit(c.collect, keywords): c.name for c in collectors
-        }
-        for future in as_completed(futures):
-            name = futures[future]
-            try:
-                items = future.result()
-                all_items.extend(items)
-                logger.info("✓ %s: %d items", name, len(items))
-            except Exception:
-                logger.exception("✗ %s: collector failed", name)
+    async def run_one(collector: BaseCollector) -> list[NewsItem]:
+        try:
+            items = await collector.acollect(keywords)
+        except Exception:
+            logger.exception("✗ %s: collector failed", collector.name)
+            return []
+        logger.info("✓ %s: %d items", collector.name, len(items))
+        return items
+
+    async def run_all() -> list[list[NewsItem]]:
+        return await asyncio.gather(*(run_one(c) for c in collectors))
+
+    all_items = [item for items in BaseCollector.run_async(run_all()) for item in items]
 
     logger.info("Total collected: %d items", len(all_items))
     return all_items
@@ -252,14 +256,15 @@ def run(config_path: str = "config.yaml") -> None:
     # 8. Update history (URLs + canonical keys for cross-source dedup)
     # 更新历史记录（URL + 规范 key，支持跨源去重）
     logger.info("--- Phase 7: Updating History ---")
-    new_urls = {item.url for item in items}
-    new_canon_keys = {
+    # dict.fromkeys 作为有序集合：新条目追加在末尾，超限时淘汰最旧的
+    new_urls = dict.fromkeys(item.url for item in items)
+    new_canon_keys = dict.fromkeys(
         key for item in items
         if (key := extract_canonical_key(item)) is not None
-    }
+    )
     save_history({
-        "urls": history.get("urls", set()) | new_urls,
-        "canonical_keys": history.get("canonical_keys", set()) | new_canon_keys,
+        "urls": history["urls"] | new_urls,
+        "canonical_keys": history["canonical_keys"] | new_canon_keys,
     })
 
     # Done
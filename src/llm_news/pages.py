@@ -8,6 +8,8 @@
 """
 
 import logging
+import os
+import re
 import shutil
 from pathlib import Path
 
@@ -18,6 +20,9 @@ logger = logging.getLogger(__name__)
 # GitHub Pages 输出目录 / GitHub Pages output directory
 PAGES_DIR = "pages"
 
+# 每日报告目录名 / Daily report directory names (YYYY-MM-DD)
+_DATE_DIR_RE = re.compile(r"\d{4}-\d{2}-\d{2}")
+
 
 def _generate_jekyll_config(site_url: str) -> str:
     """Generate _config.yml for Jekyll."""
@@ -129,6 +134,34 @@ def _generate_index_md(dates: list[str], site_url: str) -> str:
     return "\n".join(lines)
 
 
+def _write_if_changed(path: Path, content: str) -> bool:
+    """Write content to path unless the file already holds exactly that content.
+
+    内容未变时不重写，保留文件 mtime，避免下游无谓的重新部署。
+    Returns True if the file was written.
+    """
+    data = content.encode("utf-8")
+    try:
+        if path.read_bytes() == data:
+            return False
+    except FileNotFoundError:
+        pass
+    path.write_bytes(data)
+    return True
+
+
+def _list_date_dirs(pages_path: Path) -> list[str]:
+    """Return YYYY-MM-DD subdirectory names, newest first.
+
+    os.scandir 的 DirEntry 自带文件类型，无需逐项 stat。
+    """
+    with os.scandir(pages_path) as entries:
+        return sorted(
+            (e.name for e in entries if e.is_dir() and _DATE_DIR_RE.fullmatch(e.name)),
+            reverse=True,
+        )
+
+
 def build_pages(
     report: DailyReport,
     site_url: str,
@@ -157,8 +190,8 @@ def build_pages(
 
     # --- Jekyll config ---
     config_yml = _generate_jekyll_config(site_url)
-    (pages_path / "_config.yml").write_text(config_yml, encoding="utf-8")
-    logger.info("Generated _config.yml")
+    if _write_if_changed(pages_path / "_config.yml", config_yml):
+        logger.info("Generated _config.yml")
 
     # --- Build today's report ---
     day_pages = pages_path / report.date
@@ -166,8 +199,8 @@ def build_pages(
 
     # Generate Markdown
     md = _generate_report_md(report, site_url)
-    (day_pages / "index.md").write_text(md, encoding="utf-8")
-    logger.info("Generated report page: %s/index.md", day_pages)
+    if _write_if_changed(day_pages / "index.md", md):
+        logger.info("Generated report page: %s/index.md", day_pages)
 
     # Copy MP3 if exists
     mp3_src = Path(output_dir) / report.date / "daily_report.mp3"
@@ -184,12 +217,12 @@ def build_pages(
         stale_html.unlink()
         logger.info("Removed stale index.html (conflicts with Jekyll index.md)")
 
-    for sub in pages_path.iterdir():
-        if sub.is_dir() and len(sub.name) == 10:
-            stale_day_html = sub / "index.html"
-            if stale_day_html.exists():
-                stale_day_html.unlink()
-                logger.info("Removed stale %s/index.html", sub.name)
+    dates = _list_date_dirs(pages_path)
+    for d in dates:
+        stale_day_html = pages_path / d / "index.html"
+        if stale_day_html.exists():
+            stale_day_html.unlink()
+            logger.info("Removed stale %s/index.html", d)
 
     # Remove .nojekyll if present (Jekyll must be enabled)
     nojekyll = pages_path / ".nojekyll"
@@ -198,12 +231,8 @@ def build_pages(
         logger.info("Removed .nojekyll file to enable Jekyll processing")
 
     # --- Rebuild index page ---
-    dates = sorted(
-        [d.name for d in pages_path.iterdir() if d.is_dir() and len(d.name) == 10],
-        reverse=True,
-    )
     index_md = _generate_index_md(dates, site_url)
-    (pages_path / "index.md").write_text(index_md, encoding="utf-8")
-    logger.info("Generated index page with %d reports", len(dates))
+    if _write_if_changed(pages_path / "index.md", index_md):
+        logger.info("Generated index page with %d reports", len(dates))
 
     return pages_path
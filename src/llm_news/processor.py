@@ -1,17 +1,26 @@
 """LLM processor for summarization, ranking, and script generation.
 
 通过 OpenRouter (OpenAI 兼容接口) 调用免费模型。
-Two LLM calls total:
-  1. Summarize + score all items → select Top N
+Two LLM steps:
+  1. Summarize + score all items (in concurrent batches) → select Top N
   2. Generate broadcast script from Top N
 """
 
+import functools
+import hashlib
+import heapq
 import json
 import logging
+import operator
+import random
+import re
+import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import date
 
 from openai import OpenAI
 
+from .cache import load_json, save_json
 from .config import AppConfig, LlmConfig, Settings
 from .models import DailyReport, NewsItem
 
@@ -22,25 +31,37 @@ logger = logging.getLogger(__name__)
 # LLM client
 # ---------------------------------------------------------------------------
 
+# 响应体内错误（HTTP 200）中可重试的错误码：限流 / 上游过载
+_RETRYABLE_ERROR_CODES = frozenset({"429", "500", "502", "503", "504", "529"})
+_RETRY_MAX_DELAY = 60.0
+
+
+@functools.lru_cache(maxsize=4)
+def _get_client(base_url: str, api_key: str, max_retries: int) -> OpenAI:
+    """Return a cached OpenAI client for these settings.
+
+    摘要各批次与播报稿生成共用同一个客户端（及其 HTTP 连接池），复用 keep-alive 连接。
+    """
+    return OpenAI(api_key=api_key, base_url=base_url, max_retries=max_retries)
+
+
 def _call_llm(
     llm_config: LlmConfig,
     settings: Settings,
     prompt: str,
     max_tokens: int | None = None,
+    response_format: dict | None = None,
 ) -> str:
     """Call LLM via OpenRouter (OpenAI-compatible API).
 
-    使用 max_retries 配置控制 429 限流重试次数。
+    使用 max_retries 配置控制 429 限流重试次数：HTTP 层错误由 SDK 重试，
+    OpenRouter 在响应体中返回的限流 / 过载错误在此按指数退避（带抖动）重试。
     """
     api_key = settings.openrouter_api_key
     if not api_key:
         raise ValueError("OPENROUTER_API_KEY is required. Get one at https://openrouter.ai/keys")
 
-    client = OpenAI(
-        api_key=api_key,
-        base_url=llm_config.base_url,
-        max_retries=llm_config.max_retries,
-    )
+    client = _get_client(llm_config.base_url, api_key, llm_config.max_retries)
 
     kwargs: dict = {
         "model": llm_config.model,
@@ -49,18 +70,32 @@ def _call_llm(
     }
     if max_tokens:
         kwargs["max_tokens"] = max_tokens
+    if response_format:
+        kwargs["response_format"] = response_format
 
-    response = client.chat.completions.create(**kwargs)
+    for attempt in range(llm_config.max_retries + 1):
+        response = client.chat.completions.create(**kwargs)
 
-    # OpenRouter 可能在响应体中返回错误而非 HTTP 状态码
-    error = getattr(response, "error", None)
-    if error:
+        # OpenRouter 可能在响应体中返回错误而非 HTTP 状态码
+        error = getattr(response, "error", None)
+        if not error:
+            break
         err_msg = error.get("message", str(error)) if isinstance(error, dict) else str(error)
         err_code = error.get("code", "unknown") if isinstance(error, dict) else "unknown"
-        raise RuntimeError(f"OpenRouter returned error (code={err_code}): {err_msg}")
+        if str(err_code) not in _RETRYABLE_ERROR_CODES or attempt == llm_config.max_retries:
+            raise RuntimeError(f"OpenRouter returned error (code={err_code}): {err_msg}")
+        delay = random.uniform(0.5, 1.0) * min(_RETRY_MAX_DELAY, 2.0 ** (attempt + 1))
+        logger.warning(
+            "OpenRouter returned error (code=%s), retrying in %.1fs (%d/%d)",
+            err_code, delay, attempt + 1, llm_config.max_retries,
+        )
+        time.sleep(delay)
 
     if not response.choices:
-        logger.error("LLM returned empty choices. Raw response: %s", response.model_dump_json()[:500])
+        logger.error(
+            "LLM returned empty choices (id=%s, model=%s)",
+            getattr(response, "id", None), getattr(response, "model", None),
+        )
         raise ValueError("LLM returned no choices")
 
     content = response.choices[0].message.content or ""
@@ -103,6 +138,36 @@ _SUMMARIZE_PROMPT = """\
 """
 
 
+# structured_output 开启时的 response_format：strict 模式要求根节点为 object
+_SUMMARY_RESPONSE_FORMAT = {
+    "type": "json_schema",
+    "json_schema": {
+        "name": "summaries",
+        "strict": True,
+        "schema": {
+            "type": "object",
+            "properties": {
+                "items": {
+                    "type": "array",
+                    "items": {
+                        "type": "object",
+                        "properties": {
+                            "index": {"type": "integer"},
+                            "summary": {"type": "string"},
+                            "score": {"type": "number"},
+                        },
+                        "required": ["index", "summary", "score"],
+                        "additionalProperties": False,
+                    },
+                },
+            },
+            "required": ["items"],
+            "additionalProperties": False,
+        },
+    },
+}
+
+
 def _build_items_text(items: list[NewsItem]) -> str:
     parts: list[str] = []
     for i, item in enumerate(items):
@@ -114,74 +179,93 @@ def _build_items_text(items: list[NewsItem]) -> str:
     return "\n\n".join(parts)
 
 
-def _extract_json_array(text: str) -> str | None:
-    """从 LLM 响应中提取 JSON 数组，兼容各种包装格式。
+_JSON_DECODER = json.JSONDecoder()
 
-    支持: 纯 JSON、markdown 代码块、<think> 标签、截断的数组等。
+# 响应清洗 / 兜底提取用的正则，模块加载时编译一次
+_THINK_RE = re.compile(r"<think>.*?</think>", re.DOTALL)
+_FENCE_RE = re.compile(r"```(?:json)?\s*\n?(.*?)```", re.DOTALL)
+# summary 用 "非引号/反斜杠 + 转义序列" 匹配，支持 \" 且不会灾难性回溯
+_OBJECT_RE = re.compile(
+    r'\{\s*"index"\s*:\s*\d+\s*,\s*"summary"\s*:\s*"[^"\\]*(?:\\.[^"\\]*)*"\s*,'
+    r'\s*"score"\s*:\s*\d+\.?\d*\s*\}'
+)
+
+
+def _decode_array_items(text: str, pos: int) -> tuple[list[dict], bool]:
+    """Decode JSON objects of an array one by one, starting just after its '['.
+
+    用 raw_decode 逐个解析数组元素：遇到 ']' 正常结束；响应被截断或夹杂非法内容时，
+    保留此前已完整解析的对象。Returns (objects, reached_closing_bracket).
     """
-    import re
+    objects: list[dict] = []
+    n = len(text)
+    while True:
+        while pos < n and text[pos] in " \t\r\n,":
+            pos += 1
+        if pos >= n:
+            return objects, False
+        if text[pos] == "]":
+            return objects, True
+        if text[pos] != "{":
+            return objects, False
+        try:
+            obj, pos = _JSON_DECODER.raw_decode(text, pos)
+        except json.JSONDecodeError:
+            return objects, False
+        objects.append(obj)
+
 
+def _extract_json_array(text: str) -> list[dict] | None:
+    """从 LLM 响应中提取并解析 JSON 数组，兼容各种包装格式。
+
+    支持: 纯 JSON、markdown 代码块、<think> 标签、截断的数组等。
+    """
     # 1. 去除 <think>...</think> 推理标签（GLM-4.5-air 等模型）
-    text = re.sub(r"<think>.*?</think>", "", text, flags=re.DOTALL)
+    if "<think>" in text:
+        text = _THINK_RE.sub("", text)
     text = text.strip()
 
     # 2. 去除 markdown 代码块
     if "```" in text:
-        match = re.search(r"```(?:json)?\s*\n?(.*?)```", text, re.DOTALL)
+        match = _FENCE_RE.search(text)
         if match:
             text = match.group(1).strip()
 
-    # 3. 直接尝试解析
+    # 3. 直接尝试解析（structured_output 时为 {"items": [...]}）
     try:
-        json.loads(text)
-        return text
+        result = json.loads(text)
+        if isinstance(result, dict):
+            result = result.get("items")
+        if isinstance(result, list):
+            return result
     except json.JSONDecodeError:
         pass
 
-    # 4. 提取 [ ... ] 区间
+    # 4. 从第一个 '[' 起逐个解析对象（兼容前后多余文字、被 max_tokens 截断的数组）
     start = text.find("[")
     if start == -1:
         return None
 
-    end = text.rfind("]")
-    if end > start:
-        candidate = text[start:end + 1]
-        try:
-            json.loads(candidate)
-            return candidate
-        except json.JSONDecodeError:
-            pass
-
-    # 5. 处理截断的 JSON 数组（响应被 max_tokens 截断）
-    #    回退到最后一个完整的 '}'，去掉尾部逗号，补 ']'
-    truncated = text[start:]
-    last_brace = truncated.rfind("}")
-    if last_brace > 0:
-        repaired = truncated[:last_brace + 1].rstrip().rstrip(",") + "\n]"
-        try:
-            result = json.loads(repaired)
-            logger.warning(
-                "JSON array was truncated — recovered %d items (response may be incomplete)",
-                len(result),
-            )
-            return repaired
-        except json.JSONDecodeError:
-            pass
+    objects, complete = _decode_array_items(text, start + 1)
+    if complete:
+        return objects
+    if objects:
+        logger.warning(
+            "JSON array was truncated — recovered %d items (response may be incomplete)",
+            len(objects),
+        )
+        return objects
 
-    # 6. 逐对象提取（最后手段）
-    object_pattern = re.compile(
-        r'\{\s*"index"\s*:\s*\d+\s*,\s*"summary"\s*:\s*"[^"]*"\s*,\s*"score"\s*:\s*\d+\.?\d*\s*\}'
-    )
-    matches = object_pattern.findall(text)
+    # 5. 逐对象提取（最后手段）
+    matches = _OBJECT_RE.findall(text)
     if matches:
-        candidate = "[\n" + ",\n".join(matches) + "\n]"
         try:
-            result = json.loads(candidate)
+            result = [json.loads(m) for m in matches]
             logger.warning(
                 "JSON extracted via regex — recovered %d items",
                 len(result),
             )
-            return candidate
+            return result
         except json.JSONDecodeError:
             pass
 
@@ -192,31 +276,57 @@ def _parse_summary_response(
     raw: str, items: list[NewsItem]
 ) -> list[NewsItem]:
     """Parse LLM response and update items with summary + score."""
-    json_text = _extract_json_array(raw)
+    results = _extract_json_array(raw)
 
-    if json_text is None:
+    if results is None:
         logger.error("Failed to parse LLM summary response as JSON")
         logger.warning("Raw response (first 500 chars): %s", raw[:500])
         return items
 
-    try:
-        results = json.loads(json_text)
-    except json.JSONDecodeError:
-        logger.error("JSON parse failed after extraction")
-        return items
-
+    # 未开启 structured_output 时字段可能缺失，保留 .get 默认值
     parsed_count = 0
+    n = len(items)
     for entry in results:
+        if not isinstance(entry, dict):
+            continue
         idx = entry.get("index", -1)
-        if 0 <= idx < len(items):
-            items[idx].summary = entry.get("summary", "")
-            items[idx].score = float(entry.get("score", 5))
+        if 0 <= idx < n:
+            item = items[idx]
+            item.summary = entry.get("summary", "")
+            item.score = float(entry.get("score", 5))
             parsed_count += 1
 
     logger.info("Parsed %d/%d item summaries from LLM response", parsed_count, len(items))
     return items
 
 
+# 摘要缓存：按模型分文件，条目键为 url + 标题 + 送入 prompt 的内容片段
+# LLM 失败中止后重跑（或同日重跑）时，已摘要过的条目不再重复请求；
+# CI 中 data/cache 由 workflow 跨运行保留，失败的运行同样会保存
+_SUMMARY_CACHE_NAMESPACE = "llm_summaries"
+_SUMMARY_CACHE_MAX = 5_000
+
+
+def _summary_cache_key(item: NewsItem) -> str:
+    text = f"{item.url}|{item.title}|{item.content[:300]}"
+    return hashlib.sha1(text.encode("utf-8")).hexdigest()
+
+
+def _summarize_batch(
+    llm_config: LlmConfig,
+    settings: Settings,
+    batch: list[NewsItem],
+) -> list[NewsItem]:
+    """Summarize and score one batch of items in place (indices are batch-local)."""
+    prompt = _SUMMARIZE_PROMPT.format(count=len(batch), items_text=_build_items_text(batch))
+    # 每条 ~100 tokens，单批 40 条远低于上限，16000 防截断
+    response_format = _SUMMARY_RESPONSE_FORMAT if llm_config.structured_output else None
+    raw_response = _call_llm(
+        llm_config, settings, prompt, max_tokens=16000, response_format=response_format,
+    )
+    return _parse_summary_response(raw_response, batch)
+
+
 # ---------------------------------------------------------------------------
 # Step 2: Generate Broadcast Script
 # ---------------------------------------------------------------------------
@@ -278,22 +388,65 @@ def process(
         return DailyReport(date=today, total_collected=0, total_after_dedup=0)
 
     # --- Step 1: Summarize & Score ---
-    logger.info("Step 1: Summarizing %d items with LLM (%s)...", len(items), config.llm.model)
-    items_text = _build_items_text(items)
-    prompt = _SUMMARIZE_PROMPT.format(count=len(items), items_text=items_text)
+    # 先复用缓存中已有的摘要，仅将未命中的条目发给 LLM
+    summary_cache: dict[str, dict] = load_json(_SUMMARY_CACHE_NAMESPACE, config.llm.model) or {}
+    keys = [_summary_cache_key(item) for item in items]
+    pending: list[NewsItem] = []
+    for item, key in zip(items, keys):
+        hit = summary_cache.get(key)
+        if hit:
+            item.summary = hit["summary"]
+            item.score = hit["score"]
+        else:
+            pending.append(item)
+    if len(pending) < len(items):
+        logger.info("Reused %d cached summaries", len(items) - len(pending))
+
+    # 分批并发请求：单次响应更短、不易截断，且各批生成时间重叠
+    # Split into batches and summarize them concurrently
+    batch_size = max(1, config.llm.batch_size)
+    batches = [pending[i:i + batch_size] for i in range(0, len(pending), batch_size)]
+    logger.info(
+        "Step 1: Summarizing %d items in %d batch(es) with LLM (%s)...",
+        len(pending), len(batches), config.llm.model,
+    )
 
-    llm_ok = True
-    try:
-        # 154 条 × ~100 tokens/条 ≈ 15k tokens，设 16000 防截断
-        raw_response = _call_llm(config.llm, settings, prompt, max_tokens=16000)
-        items = _parse_summary_response(raw_response, items)
-    except Exception:
-        logger.exception("LLM summarization failed — will skip script generation and TTS")
-        llm_ok = False
-
-    # Sort by score descending, take top N
-    items.sort(key=lambda x: x.score, reverse=True)
-    top_items = items[:top_n]
+    failed = 0
+    workers = max(1, min(config.llm.max_concurrency, len(batches)))
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        futures = [
+            executor.submit(_summarize_batch, config.llm, settings, batch)
+            for batch in batches
+        ]
+        for n, future in enumerate(futures, 1):
+            try:
+                future.result()
+            except Exception:
+                logger.exception("LLM summarization failed for batch %d/%d", n, len(batches))
+                failed += 1
+
+    llm_ok = not batches or failed < len(batches)
+    if not llm_ok:
+        logger.error("LLM summarization failed — will skip script generation and TTS")
+    elif failed:
+        logger.warning(
+            "%d/%d summarization batches failed; their items keep score 0",
+            failed, len(batches),
+        )
+
+    # 写回新摘要；dict 保持插入顺序，超限时淘汰最旧的条目
+    if pending:
+        for item, key in zip(items, keys):
+            if item.summary:
+                summary_cache.pop(key, None)
+                summary_cache[key] = {"summary": item.summary, "score": item.score}
+        save_json(
+            _SUMMARY_CACHE_NAMESPACE, config.llm.model,
+            dict(list(summary_cache.items())[-_SUMMARY_CACHE_MAX:]),
+        )
+
+    # Take top N by score (ties keep input order; items itself is not reordered)
+    top_items = heapq.nlargest(top_n, items, key=operator.attrgetter("score"))
 
     logger.info(
         "Top %d items selected (scores: %s)",
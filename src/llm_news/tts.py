@@ -1,21 +1,62 @@
 """Text-to-Speech via Edge TTS.
 
 Edge TTS 微软免费 TTS 引擎，无需 API Key，无速率限制。
+播报稿按段落切分后并发合成，再按顺序拼接 MP3（MP3 帧可直接首尾相接）。
 """
 
 import asyncio
 import logging
+import re
+import shutil
 from pathlib import Path
 
 import edge_tts
 
 logger = logging.getLogger(__name__)
 
+# 同时进行的合成请求上限，避免触发服务端限流
+_MAX_CONCURRENT_SEGMENTS = 8
+_PARAGRAPH_RE = re.compile(r"\n\s*\n")
+
+
+def _split_segments(text: str) -> list[str]:
+    """Split the script into non-empty paragraphs."""
+    return [p.strip() for p in _PARAGRAPH_RE.split(text) if p.strip()]
+
 
 async def _generate(text: str, voice: str, rate: str, output_path: Path) -> None:
-    """Generate MP3 audio from text using Edge TTS."""
-    communicate = edge_tts.Communicate(text=text, voice=voice, rate=rate)
-    await communicate.save(str(output_path))
+    """Generate MP3 audio from text using Edge TTS.
+
+    多段落时各段并发合成到临时分段文件，完成后按顺序拼接并清理。
+    """
+    segments = _split_segments(text)
+    if len(segments) <= 1:
+        communicate = edge_tts.Communicate(text=text, voice=voice, rate=rate)
+        await communicate.save(str(output_path))
+        return
+
+    parts = [
+        output_path.with_name(f"{output_path.stem}.part{i}{output_path.suffix}")
+        for i in range(len(segments))
+    ]
+    semaphore = asyncio.Semaphore(_MAX_CONCURRENT_SEGMENTS)
+
+    async def _generate_segment(segment: str, part: Path) -> None:
+        async with semaphore:
+            communicate = edge_tts.Communicate(text=segment, voice=voice, rate=rate)
+            await communicate.save(str(part))
+
+    try:
+        await asyncio.gather(*(
+            _generate_segment(segment, part) for segment, part in zip(segments, parts)
+        ))
+        with output_path.open("wb") as out:
+            for part in parts:
+                with part.open("rb") as f:
+                    shutil.copyfileobj(f, out)
+    finally:
+        for part in parts:
+            part.unlink(missing_ok=True)
 
 
 def generate_audio(
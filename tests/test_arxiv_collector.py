@@ -0,0 +1,101 @@
+"""Tests for arXiv collector helpers.
+
+测试 OAI-PMH 记录解析与机构匹配。
+"""
+
+import xml.etree.ElementTree as ET
+
+from llm_news.collectors.arxiv_collector import (
+    DEFAULT_KNOWN_INSTITUTIONS,
+    _atom_entry_to_result,
+    _build_affiliation_matcher,
+    _matches_institution,
+    _oai_record_to_result,
+)
+
+_RECORD = """\
+<record xmlns="http://www.openarchives.org/OAI/2.0/">
+  <header><identifier>oai:arXiv.org:2602.06570</identifier></header>
+  <metadata>
+    <arXiv xmlns="http://arxiv.org/OAI/arXiv/">
+      <id>2602.06570</id>
+      <created>2026-02-06</created>
+      <authors>
+        <author><keyname>Smith</keyname><forenames>John</forenames></author>
+        <author><keyname>Doe</keyname></author>
+      </authors>
+      <title>Baichuan-M3: Modeling Clinical Inquiry</title>
+      <categories>cs.CL cs.AI</categories>
+      <comments>Work done at Tsinghua University</comments>
+      <abstract>We study LLMs.</abstract>
+    </arXiv>
+  </metadata>
+</record>
+"""
+
+_ATOM_ENTRY = """\
+<entry xmlns="http://www.w3.org/2005/Atom" xmlns:arxiv="http://arxiv.org/schemas/atom">
+  <id>http://arxiv.org/abs/2602.06570v1</id>
+  <updated>2026-02-06T18:00:00Z</updated>
+  <published>2026-02-06T18:00:00Z</published>
+  <title>Baichuan-M3: Modeling
+  Clinical Inquiry</title>
+  <summary>We study LLMs.</summary>
+  <author><name>John Smith</name></author>
+  <author><name>Jane Doe</name></author>
+  <arxiv:comment>Work done at OpenAI</arxiv:comment>
+  <arxiv:primary_category term="cs.CL"/>
+  <category term="cs.CL"/>
+  <category term="cs.AI"/>
+</entry>
+"""
+
+
+class TestAtomEntryToResult:
+    """API Atom entry 解析测试"""
+
+    def test_fields(self):
+        """字段映射"""
+        result = _atom_entry_to_result(ET.fromstring(_ATOM_ENTRY))
+        assert result.entry_id == "http://arxiv.org/abs/2602.06570v1"
+        assert [a.name for a in result.authors] == ["John Smith", "Jane Doe"]
+        assert result.comment == "Work done at OpenAI"
+        assert result.primary_category == "cs.CL"
+        assert result.categories == ["cs.CL", "cs.AI"]
+        assert result.published.tzinfo is not None
+
+    def test_api_error_entry(self):
+        """API 错误 entry 返回 None"""
+        entry = ET.fromstring(
+            '<entry xmlns="http://www.w3.org/2005/Atom">'
+            "<id>http://arxiv.org/api/errors#incorrect_id_format</id>"
+            "<title>Error</title></entry>"
+        )
+        assert _atom_entry_to_result(entry) is None
+
+
+class TestOaiRecordToResult:
+    """OAI-PMH 记录解析测试"""
+
+    def test_fields(self):
+        """字段映射"""
+        result = _oai_record_to_result(ET.fromstring(_RECORD))
+        assert result.entry_id == "http://arxiv.org/abs/2602.06570"
+        assert result.title == "Baichuan-M3: Modeling Clinical Inquiry"
+        assert [a.name for a in result.authors] == ["John Smith", "Doe"]
+        assert result.categories == ["cs.CL", "cs.AI"]
+        assert result.published.strftime("%Y-%m-%d") == "2026-02-06"
+
+    def test_deleted_record(self):
+        """已删除记录（无 metadata）返回 None"""
+        record = ET.fromstring(
+            '<record xmlns="http://www.openarchives.org/OAI/2.0/">'
+            '<header status="deleted"><identifier>x</identifier></header></record>'
+        )
+        assert _oai_record_to_result(record) is None
+
+    def test_institution_filter(self):
+        """OAI 结果可直接复用机构过滤"""
+        result = _oai_record_to_result(ET.fromstring(_RECORD))
+        matcher = _build_affiliation_matcher(DEFAULT_KNOWN_INSTITUTIONS)
+        assert _matches_institution(result, matcher)
@@ -0,0 +1,125 @@
+"""Tests for blog collector feed parsing.
+
+测试 RSS 2.0 / Atom 快速解析路径与 feedparser 回退。
+"""
+
+from datetime import datetime, timezone
+
+from llm_news.collectors.blog_collector import (
+    _entries_to_items,
+    _html_to_text,
+    _parse_feed,
+    _parse_feed_fallback,
+)
+
+_RSS = b"""\
+<?xml version="1.0" encoding="utf-8"?>
+<rss version="2.0" xmlns:content="http://purl.org/rss/1.0/modules/content/">
+  <channel>
+    <title>Example Blog</title>
+    <item>
+      <title>Scaling LLM &amp; agents</title>
+      <link>https://example.com/a</link>
+      <description>&lt;p&gt;New &lt;b&gt;LLM&lt;/b&gt; results&lt;/p&gt;&lt;script&gt;alert(1)&lt;/script&gt;</description>
+      <content:encoded><![CDATA[<p>Full text</p>]]></content:encoded>
+      <pubDate>Mon, 01 Jan 2024 12:30:00 +0800</pubDate>
+    </item>
+    <item>
+      <title>Unrelated post</title>
+      <link>https://example.com/b</link>
+      <description>Cooking</description>
+    </item>
+  </channel>
+</rss>
+"""
+
+_ATOM = b"""\
+<?xml version="1.0" encoding="utf-8"?>
+<feed xmlns="http://www.w3.org/2005/Atom">
+  <title>Example</title>
+  <entry>
+    <title type="html">GPT &lt;i&gt;notes&lt;/i&gt;</title>
+    <link rel="replies" href="https://example.com/comments"/>
+    <link href="https://example.com/post"/>
+    <summary>Summary text</summary>
+    <updated>2024-01-02T03:04:05Z</updated>
+  </entry>
+</feed>
+"""
+
+_RDF = b"""\
+<?xml version="1.0"?>
+<rdf:RDF xmlns:rdf="http://www.w3.org/1999/02/22-rdf-syntax-ns#"
+         xmlns="http://purl.org/rss/1.0/">
+  <channel rdf:about="https://example.com/"><title>RDF</title></channel>
+  <item rdf:about="https://example.com/r">
+    <title>RDF item</title>
+    <link>https://example.com/r</link>
+  </item>
+</rdf:RDF>
+"""
+
+# 标题含 "<" / "&" 等字符（纯文本）：快速路径与 feedparser 结果应一致
+_SPECIAL_RSS = b"""\
+<?xml version="1.0"?>
+<rss version="2.0"><channel><title>x</title>
+  <item>
+    <title>A &lt; B &amp; C &gt; D</title>
+    <link>https://example.com/a</link>
+    <description>&lt;p&gt;Tom &amp;amp; Jerry &amp;lt;3&lt;/p&gt;</description>
+  </item>
+</channel></rss>
+"""
+
+_SPECIAL_ATOM = b"""\
+<?xml version="1.0"?>
+<feed xmlns="http://www.w3.org/2005/Atom"><title>x</title>
+  <entry>
+    <title>A &lt; B &amp; C</title>
+    <link href="https://example.com/a"/>
+    <summary>x &lt; y</summary>
+  </entry>
+</feed>
+"""
+
+
+class TestParseFeed:
+    """feed 解析测试"""
+
+    def test_rss_fast_path(self):
+        """RSS 2.0：字段提取、去标签、日期转 UTC"""
+        entry = _parse_feed(_RSS).entries[0]
+        assert entry["title"] == "Scaling LLM & agents"
+        assert entry["link"] == "https://example.com/a"
+        assert entry["summary"] == "New LLM results"
+        assert entry["content"][0]["value"] == "Full text"
+
+        item = _entries_to_items(_parse_feed(_RSS), "Example", None)[0]
+        assert item.published_at == datetime(2024, 1, 1, 4, 30, tzinfo=timezone.utc)
+
+    def test_atom_fast_path(self):
+        """Atom：取 alternate 链接，published 缺失时用 updated"""
+        item = _entries_to_items(_parse_feed(_ATOM), "Example", None)[0]
+        assert item.title == "GPT notes"
+        assert item.url == "https://example.com/post"
+        assert item.content == "Summary text"
+        assert item.published_at == datetime(2024, 1, 2, 3, 4, 5, tzinfo=timezone.utc)
+
+    def test_fallback_to_feedparser(self):
+        """RSS 1.0 (RDF) 回退 feedparser"""
+        feed = _parse_feed(_RDF)
+        assert [e["title"] for e in feed.entries] == ["RDF item"]
+
+    def test_malformed_falls_back(self):
+        """XML 不合法时由 feedparser 容错解析"""
+        feed = _parse_feed(_RSS.replace(b"</channel>", b""))
+        assert feed.entries[0]["link"] == "https://example.com/a"
+
+    def test_fast_path_matches_feedparser(self):
+        """同一 feed 经快速路径与 feedparser：标题一致，正文归一为文本后一致"""
+        for feed in (_SPECIAL_RSS, _SPECIAL_ATOM):
+            fast = _parse_feed(feed).entries[0]
+            slow = _parse_feed_fallback(feed).entries[0]
+            assert fast["title"] == slow["title"]
+            assert fast["summary"] == _html_to_text(slow["summary"])
+        assert _parse_feed(_SPECIAL_RSS).entries[0]["title"] == "A < B & C > D"
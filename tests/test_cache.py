@@ -0,0 +1,130 @@
+"""Tests for the collector result disk cache.
+
+测试 TTL 磁盘缓存：写入 / 命中 / 过期。
+"""
+
+import asyncio
+import os
+import time
+
+import httpx
+import pytest
+
+from llm_news import cache
+from llm_news.collectors import github_collector
+from llm_news.models import NewsItem
+
+
+@pytest.fixture(autouse=True)
+def _tmp_cache_dir(tmp_path, monkeypatch):
+    monkeypatch.setattr(cache, "CACHE_DIR", tmp_path / "cache")
+
+
+def _make_item(title: str = "Test Item") -> NewsItem:
+    return NewsItem(
+        title=title,
+        url="https://example.com/test",
+        source="arxiv",
+        source_name="CL",
+    )
+
+
+class TestCache:
+    """磁盘缓存测试"""
+
+    def test_miss(self):
+        """无缓存时返回 None"""
+        assert cache.load_items("arxiv", "q", ttl=60) is None
+
+    def test_roundtrip(self):
+        """写入后可读回"""
+        cache.save_items("arxiv", "q", [_make_item("A"), _make_item("B")])
+        items = cache.load_items("arxiv", "q", ttl=60)
+        assert [it.title for it in items] == ["A", "B"]
+
+    def test_empty_list_is_hit(self):
+        """空结果也算命中（区别于未命中）"""
+        cache.save_items("arxiv", "q", [])
+        assert cache.load_items("arxiv", "q", ttl=60) == []
+
+    def test_expired(self):
+        """超过 TTL 视为未命中"""
+        cache.save_items("arxiv", "q", [_make_item()])
+        path = cache._cache_path("arxiv", "q")
+        old = time.time() - 120
+        os.utime(path, (old, old))
+        assert cache.load_items("arxiv", "q", ttl=60) is None
+
+    def test_namespaces_isolated(self):
+        """不同 namespace 互不影响"""
+        cache.save_items("arxiv", "q", [_make_item()])
+        assert cache.load_items("github", "q", ttl=60) is None
+
+
+class TestValidatedCache:
+    """条件请求缓存测试（ETag / Last-Modified）"""
+
+    def test_roundtrip(self):
+        """保存校验头后返回条件请求头和上次结果"""
+        cache.save_validated(
+            "blog", "u", {"etag": '"abc"', "last-modified": "Mon, 01 Jan 2024 00:00:00 GMT"},
+            [_make_item("A")],
+        )
+        headers, items = cache.load_validated("blog", "u")
+        assert headers == {
+            "If-None-Match": '"abc"',
+            "If-Modified-Since": "Mon, 01 Jan 2024 00:00:00 GMT",
+        }
+        assert [it.title for it in items] == ["A"]
+
+    def test_no_validators_not_saved(self):
+        """响应无 ETag / Last-Modified 时不缓存"""
+        cache.save_validated("blog", "u", {}, [_make_item()])
+        assert cache.load_validated("blog", "u") is None
+
+    def test_json_payload(self):
+        """任意 JSON payload 可随校验头保存"""
+        cache.save_validated_json("hf_models", "org", {"etag": 'W/"1"'}, [{"id": "org/m"}])
+        headers, payload = cache.load_validated_json("hf_models", "org")
+        assert headers == {"If-None-Match": 'W/"1"'}
+        assert payload == [{"id": "org/m"}]
+
+    def test_touch_resets_age(self):
+        """touch 后缓存年龄归零（304 重新验证后视为新鲜）"""
+        assert cache.cache_age("hf_papers", "30") is None
+        cache.save_validated_json("hf_papers", "30", {"etag": '"1"'}, [])
+        path = cache._cache_path("hf_papers", "30")
+        old = time.time() - 7200
+        os.utime(path, (old, old))
+        assert cache.cache_age("hf_papers", "30") > 3600
+        cache.touch("hf_papers", "30")
+        assert cache.cache_age("hf_papers", "30") < 60
+
+
+class TestDailyCacheKey:
+    """按天缓存：次日运行不复用前一天的结果"""
+
+    def test_github_releases_cache_scoped_to_day(self, monkeypatch):
+        """同日命中缓存，换日重新请求"""
+        requests: list[str] = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            requests.append(request.url.path)
+            return httpx.Response(200, json=[{
+                "tag_name": "v1", "name": "v1", "body": "",
+                "html_url": "https://github.com/o/r/releases/tag/v1",
+                "published_at": "2024-01-01T00:00:00Z",
+            }])
+
+        async def run():
+            async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as client:
+                return await github_collector.GithubCollector(repos=["o/r"], http=client).acollect([])
+
+        monkeypatch.setattr(github_collector, "utc_today", lambda: "2024-01-01")
+        asyncio.run(run())
+        asyncio.run(run())
+        assert len(requests) == 1
+
+        monkeypatch.setattr(github_collector, "utc_today", lambda: "2024-01-02")
+        assert [it.title for it in asyncio.run(run())]
+        assert len(requests) == 2
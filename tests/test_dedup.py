@@ -3,16 +3,20 @@
 测试多层去重策略：URL 标准化 / 规范 ID / 标题匹配 / 来源优先级。
 """
 
+import logging
 from datetime import datetime, timezone
 
 import pytest
 
+from llm_news import dedup
 from llm_news.dedup import (
     SOURCE_PRIORITY,
     deduplicate,
     extract_canonical_key,
+    load_history,
     normalize_title,
     normalize_url,
+    save_history,
 )
 from llm_news.models import NewsItem
 
@@ -36,8 +40,35 @@ def _make_item(
     )
 
 
-def _empty_history() -> dict[str, set[str]]:
-    return {"urls": set(), "canonical_keys": set()}
+# deduplicate 只读取 history，共享一份不可变的空历史即可
+_EMPTY_HISTORY: dict[str, frozenset[str]] = {"urls": frozenset(), "canonical_keys": frozenset()}
+
+
+# 多个用例共用的真实重复样本（deduplicate 不修改条目，可安全共享）
+_HF_BAICHUAN = _make_item(
+    title="Baichuan-M3: Modeling Clinical Inquiry for Reliable Medical Decision-Making",
+    url="https://huggingface.co/papers/2602.06570",
+    source="hf_papers",
+    source_name="HF Daily Papers",
+)
+_ARXIV_BAICHUAN = _make_item(
+    title="Baichuan-M3: Modeling Clinical Inquiry for Reliable Medical Decision-Making",
+    url="http://arxiv.org/abs/2602.06570v1",
+    source="arxiv",
+    source_name="CL",
+)
+_HN_CHATGPT = _make_item(
+    title="Testing Ads in ChatGPT",
+    url="https://openai.com/index/testing-ads-in-chatgpt/",
+    source="hackernews",
+    source_name="Hacker News",
+)
+_BLOG_CHATGPT = _make_item(
+    title="Testing ads in ChatGPT",
+    url="https://openai.com/index/testing-ads-in-chatgpt",
+    source="blog",
+    source_name="OpenAI",
+)
 
 
 # ── normalize_url tests ──────────────────────────────────────────────────
@@ -66,6 +97,13 @@ class TestNormalizeUrl:
         assert normalize_url("https://example.com/page?utm_source=twitter&id=123") == \
                "https://example.com/page?id=123"
 
+    def test_strip_tracking_params_keeps_others(self):
+        """追踪参数名不区分大小写，其余参数保持原样"""
+        assert normalize_url("https://example.com/page?a=1&UTM_Medium=x&b=2&fbclid=y") == \
+               "https://example.com/page?a=1&b=2"
+        assert normalize_url("https://example.com/page?only_ref=1") == \
+               "https://example.com/page?only_ref=1"
+
     def test_empty_url(self):
         """空 URL"""
         assert normalize_url("") == ""
@@ -79,6 +117,19 @@ class TestNormalizeUrl:
         assert normalize_url("https://example.com/page#section") == \
                "https://example.com/page"
 
+    def test_empty_query_pairs(self):
+        """空参数段与首尾 & 不影响结果"""
+        expected = normalize_url("https://example.com/p?a=1")
+        assert normalize_url("https://example.com/p?a=1&") == expected
+        assert normalize_url("https://example.com/p?&a=1") == expected
+        assert normalize_url("https://example.com/p?a=1&&b=2") == \
+               normalize_url("https://example.com/p?a=1&b=2")
+
+    def test_space_encoding(self):
+        """空格的 + 与 %20 编码视为相同"""
+        assert normalize_url("https://example.com/s?q=a+b") == \
+               normalize_url("https://example.com/s?q=a%20b")
+
 
 # ── extract_canonical_key tests ──────────────────────────────────────────
 
@@ -156,37 +207,13 @@ class TestDeduplicateIntegration:
         Baichuan-M3 同时出现在 hf_papers 和 arxiv，应去重为 1 条，
         保留 arxiv（原始来源，优先级更高）。
         """
-        hf_item = _make_item(
-            title="Baichuan-M3: Modeling Clinical Inquiry for Reliable Medical Decision-Making",
-            url="https://huggingface.co/papers/2602.06570",
-            source="hf_papers",
-            source_name="HF Daily Papers",
-        )
-        arxiv_item = _make_item(
-            title="Baichuan-M3: Modeling Clinical Inquiry for Reliable Medical Decision-Making",
-            url="http://arxiv.org/abs/2602.06570v1",
-            source="arxiv",
-            source_name="CL",
-        )
-        result = deduplicate([hf_item, arxiv_item], _empty_history())
+        result = deduplicate([_HF_BAICHUAN, _ARXIV_BAICHUAN], _EMPTY_HISTORY)
         assert len(result) == 1
         assert result[0].source == "arxiv"  # 原始来源优先
 
     def test_case1_arxiv_first(self):
         """arxiv 先出现时也应保留 arxiv"""
-        arxiv_item = _make_item(
-            title="Baichuan-M3: Modeling Clinical Inquiry for Reliable Medical Decision-Making",
-            url="http://arxiv.org/abs/2602.06570v1",
-            source="arxiv",
-            source_name="CL",
-        )
-        hf_item = _make_item(
-            title="Baichuan-M3: Modeling Clinical Inquiry for Reliable Medical Decision-Making",
-            url="https://huggingface.co/papers/2602.06570",
-            source="hf_papers",
-            source_name="HF Daily Papers",
-        )
-        result = deduplicate([arxiv_item, hf_item], _empty_history())
+        result = deduplicate([_ARXIV_BAICHUAN, _HF_BAICHUAN], _EMPTY_HISTORY)
         assert len(result) == 1
         assert result[0].source == "arxiv"
 
@@ -196,37 +223,13 @@ class TestDeduplicateIntegration:
         OpenAI ChatGPT 广告测试文章同时出现在 blog 和 hackernews，
         URL 仅差末尾 /，应去重为 1 条，保留 blog（原始来源）。
         """
-        hn_item = _make_item(
-            title="Testing Ads in ChatGPT",
-            url="https://openai.com/index/testing-ads-in-chatgpt/",
-            source="hackernews",
-            source_name="Hacker News",
-        )
-        blog_item = _make_item(
-            title="Testing ads in ChatGPT",
-            url="https://openai.com/index/testing-ads-in-chatgpt",
-            source="blog",
-            source_name="OpenAI",
-        )
-        result = deduplicate([hn_item, blog_item], _empty_history())
+        result = deduplicate([_HN_CHATGPT, _BLOG_CHATGPT], _EMPTY_HISTORY)
         assert len(result) == 1
         assert result[0].source == "blog"  # 原始来源优先
 
     def test_case2_blog_first(self):
         """blog 先出现时也应保留 blog"""
-        blog_item = _make_item(
-            title="Testing ads in ChatGPT",
-            url="https://openai.com/index/testing-ads-in-chatgpt",
-            source="blog",
-            source_name="OpenAI",
-        )
-        hn_item = _make_item(
-            title="Testing Ads in ChatGPT",
-            url="https://openai.com/index/testing-ads-in-chatgpt/",
-            source="hackernews",
-            source_name="Hacker News",
-        )
-        result = deduplicate([blog_item, hn_item], _empty_history())
+        result = deduplicate([_BLOG_CHATGPT, _HN_CHATGPT], _EMPTY_HISTORY)
         assert len(result) == 1
         assert result[0].source == "blog"
 
@@ -244,7 +247,7 @@ class TestDeduplicateIntegration:
             source="hackernews",
             source_name="Hacker News",
         )
-        result = deduplicate([item1, item2], _empty_history())
+        result = deduplicate([item1, item2], _EMPTY_HISTORY)
         assert len(result) == 1
         assert result[0].source == "blog"  # blog priority < hackernews
 
@@ -260,7 +263,7 @@ class TestDeduplicateIntegration:
             url="https://example.com/b",
             source="hackernews",
         )
-        result = deduplicate([item1, item2], _empty_history())
+        result = deduplicate([item1, item2], _EMPTY_HISTORY)
         # Short title ("gpt 5" = 5 chars) should NOT trigger title dedup,
         # but URL normalization also won't match → both should remain
         assert len(result) == 2
@@ -272,7 +275,7 @@ class TestDeduplicateIntegration:
             _make_item(title="News B", url="https://b.com/2", source="arxiv"),
             _make_item(title="News C", url="https://c.com/3", source="hackernews"),
         ]
-        result = deduplicate(items, _empty_history())
+        result = deduplicate(items, _EMPTY_HISTORY)
         assert len(result) == 3
 
     def test_history_url_filter(self):
@@ -301,7 +304,7 @@ class TestDeduplicateIntegration:
 
     def test_empty_input(self):
         """空输入"""
-        result = deduplicate([], _empty_history())
+        result = deduplicate([], _EMPTY_HISTORY)
         assert len(result) == 0
 
     def test_source_priority_values(self):
@@ -331,6 +334,104 @@ class TestDeduplicateIntegration:
             source="reddit",
             source_name="r/MachineLearning",
         )
-        result = deduplicate([hf_item, reddit_item, arxiv_item], _empty_history())
+        result = deduplicate([hf_item, reddit_item, arxiv_item], _EMPTY_HISTORY)
         assert len(result) == 1
         assert result[0].source == "arxiv"  # 最高优先级
+
+    def test_near_duplicate_title(self, caplog):
+        """长标题前缀相同、仅多出少量词（如转发后缀）时视为重复，并以 info 记录两个标题"""
+        blog_item = _make_item(
+            title="Introducing Gemma 3n: a mobile-first multimodal open model for developers",
+            url="https://developers.googleblog.com/en/introducing-gemma-3n",
+            source="blog",
+        )
+        reddit_item = _make_item(
+            title="Introducing Gemma 3n: a mobile-first multimodal open model for developers now",
+            url="https://reddit.com/r/LocalLLaMA/comments/xyz",
+            source="reddit",
+        )
+        with caplog.at_level(logging.INFO, logger="llm_news.dedup"):
+            result = deduplicate([reddit_item, blog_item], _EMPTY_HISTORY)
+        assert len(result) == 1
+        assert result[0].source == "blog"
+        merges = [r.getMessage() for r in caplog.records if "Near-duplicate" in r.getMessage()]
+        assert len(merges) == 1
+        assert reddit_item.title in merges[0] and blog_item.title in merges[0]
+
+    def test_similar_prefix_different_title_kept(self):
+        """前缀相同但内容不同的长标题不合并"""
+        item1 = _make_item(
+            title="DeepSeek releases new open reasoning model benchmarks for V3",
+            url="https://example.com/v3",
+        )
+        item2 = _make_item(
+            title="DeepSeek releases new open reasoning model benchmarks for V4",
+            url="https://example.com/v4",
+        )
+        result = deduplicate([item1, item2], _EMPTY_HISTORY)
+        assert len(result) == 2
+
+    def test_similar_title_version_difference_kept(self):
+        """仅版本号不同的近似标题不合并（不同 release）"""
+        item1 = _make_item(
+            title="vLLM adds speculative decoding and chunked prefill support for all models in release 0.6.1",
+            url="https://blog.vllm.ai/2024/09/01/release-0-6-1",
+        )
+        item2 = _make_item(
+            title="vLLM adds speculative decoding and chunked prefill support for all models in release 0.6.2",
+            url="https://blog.vllm.ai/2024/10/01/release-0-6-2",
+        )
+        result = deduplicate([item1, item2], _EMPTY_HISTORY)
+        assert len(result) == 2
+
+    def test_similar_title_different_arxiv_ids_kept(self):
+        """arxiv ID 不同的论文即使标题近似也不合并"""
+        def paper(arxiv_id: str, title: str) -> NewsItem:
+            return _make_item(title=title, url=f"https://arxiv.org/abs/{arxiv_id}", source="arxiv")
+
+        base = "Scaling Laws for Mixture-of-Experts Language Models Trained on"
+        # 差异为数字
+        result = deduplicate([
+            paper("2401.00001", f"{base} 2 Trillion Tokens of Web Data"),
+            paper("2402.00002", f"{base} 15 Trillion Tokens of Web Data"),
+        ], _EMPTY_HISTORY)
+        assert len(result) == 2
+        # 差异为普通词，仅靠 ID 区分
+        result = deduplicate([
+            paper("2401.00001", f"{base} Trillions of Tokens of Web Data"),
+            paper("2402.00002", f"{base} Trillions of Tokens of Code Data"),
+        ], _EMPTY_HISTORY)
+        assert len(result) == 2
+
+
+# ── History persistence tests ────────────────────────────────────────────
+
+
+class TestHistory:
+    """历史记录读写测试"""
+
+    @pytest.fixture(autouse=True)
+    def _tmp_history(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(dedup, "HISTORY_PATH", tmp_path / "history.json")
+
+    def test_roundtrip_keeps_insertion_order(self):
+        """按插入顺序保存和读取"""
+        urls = ["https://b.com", "https://a.com", "https://c.com"]
+        save_history({"urls": dict.fromkeys(urls), "canonical_keys": {}})
+        assert list(load_history()["urls"]) == urls
+
+    def test_trim_drops_oldest(self):
+        """超出上限时丢弃最早的条目"""
+        urls = [f"https://example.com/{i}" for i in range(10_005)]
+        save_history({"urls": dict.fromkeys(urls), "canonical_keys": {}})
+        loaded = list(load_history()["urls"])
+        assert len(loaded) == 10_000
+        assert loaded[0] == "https://example.com/5"
+        assert loaded[-1] == "https://example.com/10004"
+
+    def test_save_replaces_atomically(self, tmp_path):
+        """写入经临时文件原子替换，不残留临时文件"""
+        save_history({"urls": {"https://old.com": None}, "canonical_keys": {}})
+        save_history({"urls": {"https://new.com": None}, "canonical_keys": {}})
+        assert list(load_history()["urls"]) == ["https://new.com"]
+        assert [p.name for p in tmp_path.iterdir()] == ["history.json"]
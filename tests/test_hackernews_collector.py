@@ -0,0 +1,62 @@
+"""Tests for the Hacker News collector source selection.
+
+测试 Algolia / Firebase 选择：topstories 只走 Firebase，newstories 返回不足时回退 Firebase。
+"""
+
+import asyncio
+
+import httpx
+
+from llm_news.collectors.hackernews_collector import HackerNewsCollector
+
+
+def _story(i: int) -> dict:
+    return {"id": i, "type": "story", "title": f"LLM story {i}", "url": f"https://example.com/{i}"}
+
+
+def _hit(i: int) -> dict:
+    return {"objectID": str(i), "title": f"LLM story {i}", "url": f"https://example.com/{i}"}
+
+
+def _collect(story_type: str, limit: int, algolia_hits: int) -> tuple[list[str], list]:
+    """运行 collector，返回 (请求路径列表, 条目)"""
+    paths: list[str] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        paths.append(request.url.path)
+        if request.url.host == "hn.algolia.com":
+            return httpx.Response(200, json={"hits": [_hit(i) for i in range(algolia_hits)]})
+        if request.url.path.endswith(f"/{story_type}.json"):
+            return httpx.Response(200, json=list(range(500)))
+        story_id = int(request.url.path.rsplit("/", 1)[1].removesuffix(".json"))
+        return httpx.Response(200, json=_story(story_id))
+
+    async def run():
+        async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as client:
+            collector = HackerNewsCollector(story_type=story_type, limit=limit, http=client)
+            return await collector.acollect(["llm"])
+
+    items = asyncio.run(run())
+    return paths, items
+
+
+class TestHackerNewsSource:
+    """数据源选择测试"""
+
+    def test_newstories_uses_algolia(self):
+        """newstories 一次 Algolia 请求拿到全部条目"""
+        paths, items = _collect("newstories", limit=20, algolia_hits=20)
+        assert paths == ["/api/v1/search_by_date"]
+        assert len(items) == 20
+
+    def test_topstories_uses_firebase(self):
+        """topstories 直接走 Firebase，保持默认 limit 条数"""
+        paths, items = _collect("topstories", limit=60, algolia_hits=30)
+        assert not any(p.startswith("/api/v1/") for p in paths)
+        assert len(items) == 60
+
+    def test_algolia_shortfall_falls_back(self):
+        """Algolia 返回不足 limit 时回退 Firebase"""
+        paths, items = _collect("newstories", limit=30, algolia_hits=25)
+        assert paths[0] == "/api/v1/search_by_date"
+        assert len(items) == 30
@@ -0,0 +1,148 @@
+"""Tests for LLM response parsing in the processor.
+
+测试从 LLM 响应中提取 JSON 数组：包装格式、截断、兜底提取；以及摘要缓存。
+"""
+
+import json
+import re
+from types import SimpleNamespace
+
+import pytest
+
+from llm_news import cache, processor
+from llm_news.config import AppConfig, LlmConfig, Settings
+from llm_news.models import NewsItem
+from llm_news.processor import _extract_json_array
+
+_A = '{"index": 0, "summary": "A", "score": 8}'
+_B = '{"index": 1, "summary": "B", "score": 6.5}'
+
+
+class TestExtractJsonArray:
+    """JSON 数组提取测试"""
+
+    def test_plain(self):
+        """纯 JSON 数组"""
+        assert _extract_json_array(f"[{_A}, {_B}]") == [
+            {"index": 0, "summary": "A", "score": 8},
+            {"index": 1, "summary": "B", "score": 6.5},
+        ]
+
+    def test_think_and_fence(self):
+        """去除 <think> 标签与 markdown 代码块"""
+        text = f"<think>[reasoning]</think>\n```json\n[{_A}]\n```"
+        assert _extract_json_array(text) == [{"index": 0, "summary": "A", "score": 8}]
+
+    def test_surrounding_text(self):
+        """数组前后带说明文字"""
+        text = f"Here you go:\n[{_A}, {_B}]\nHope this helps [1]."
+        assert [e["index"] for e in _extract_json_array(text)] == [0, 1]
+
+    def test_truncated(self):
+        """被截断的数组保留已完整的对象"""
+        text = f'[{_A}, {_B}, {{"index": 2, "summary": "C is cut'
+        assert [e["index"] for e in _extract_json_array(text)] == [0, 1]
+
+    def test_regex_fallback(self):
+        """数组结构损坏时逐对象提取"""
+        text = f"[oops {_A} ... {_B}"
+        assert [e["index"] for e in _extract_json_array(text)] == [0, 1]
+
+    def test_no_array(self):
+        """无数组时返回 None"""
+        assert _extract_json_array("sorry, I cannot help") is None
+
+    def test_regex_fallback_escaped_quote(self):
+        """兜底提取支持 summary 中的转义引号"""
+        text = r'[oops {"index": 3, "summary": "say \"hi\"", "score": 7}'
+        assert _extract_json_array(text) == [{"index": 3, "summary": 'say "hi"', "score": 7}]
+
+    def test_structured_output_object(self):
+        """json_schema 结构化输出的 {"items": [...]} 根对象"""
+        assert _extract_json_array(f'{{"items": [{_A}]}}') == [
+            {"index": 0, "summary": "A", "score": 8},
+        ]
+
+
+class TestSummaryCache:
+    """摘要缓存测试"""
+
+    def test_rerun_reuses_summaries(self, tmp_path, monkeypatch):
+        """重跑时已摘要的条目不再请求 LLM"""
+        monkeypatch.setattr(cache, "CACHE_DIR", tmp_path / "cache")
+        prompts: list[str] = []
+
+        def fake_call_llm(llm_config, settings, prompt, max_tokens=None, response_format=None):
+            prompts.append(prompt)
+            if "播报稿" in prompt:
+                return "script"
+            indices = re.findall(r"^\[(\d+)\]", prompt, re.MULTILINE)
+            return json.dumps([{"index": int(i), "summary": f"S{i}", "score": 5} for i in indices])
+
+        monkeypatch.setattr(processor, "_call_llm", fake_call_llm)
+
+        def make_items():
+            return [
+                NewsItem(title=f"T{i}", url=f"https://example.com/{i}", source="arxiv", source_name="CL")
+                for i in range(3)
+            ]
+
+        processor.process(make_items(), AppConfig(), Settings())
+        assert len(prompts) == 2
+
+        prompts.clear()
+        report = processor.process(make_items(), AppConfig(), Settings())
+        assert len(prompts) == 1  # 仅播报稿
+        assert report.llm_ok
+        assert {it.summary for it in report.top_items} == {"S0", "S1", "S2"}
+
+
+class _FakeCompletions:
+    """按顺序返回预设响应的 chat.completions 替身"""
+
+    def __init__(self, responses):
+        self.responses = list(responses)
+        self.calls = 0
+
+    def create(self, **kwargs):
+        self.calls += 1
+        return self.responses.pop(0)
+
+
+def _response(content=None, error=None):
+    message = SimpleNamespace(content=content, reasoning_content=None)
+    choices = [SimpleNamespace(message=message)] if content is not None else []
+    return SimpleNamespace(error=error, choices=choices)
+
+
+class TestCallLlm:
+    """LLM 调用重试测试"""
+
+    @pytest.fixture
+    def completions(self, monkeypatch):
+        fake = _FakeCompletions([])
+        client = SimpleNamespace(chat=SimpleNamespace(completions=fake))
+        monkeypatch.setattr(processor, "_get_client", lambda *args: client)
+        monkeypatch.setattr(processor.time, "sleep", lambda _: None)
+        return fake
+
+    def test_retries_in_body_rate_limit(self, completions):
+        """响应体内的 429 错误会退避重试"""
+        completions.responses = [_response(error={"code": 429, "message": "rate limited"}), _response("ok")]
+        settings = Settings(openrouter_api_key="k")
+        assert processor._call_llm(LlmConfig(), settings, "hi") == "ok"
+        assert completions.calls == 2
+
+    def test_non_retryable_error_raises(self, completions):
+        """不可重试的错误直接抛出"""
+        completions.responses = [_response(error={"code": 400, "message": "bad request"})]
+        with pytest.raises(RuntimeError, match="code=400"):
+            processor._call_llm(LlmConfig(), Settings(openrouter_api_key="k"), "hi")
+        assert completions.calls == 1
+
+    def test_gives_up_after_max_retries(self, completions):
+        """超过 max_retries 后抛出"""
+        completions.responses = [_response(error={"code": 529, "message": "overloaded"})] * 3
+        with pytest.raises(RuntimeError, match="code=529"):
+            processor._call_llm(LlmConfig(max_retries=2), Settings(openrouter_api_key="k"), "hi")
+        assert completions.calls == 3
@@ -0,0 +1,53 @@
+"""Tests for the Reddit collector.
+
+测试逐子版块拉取：各取 limit 条、单个子版块失败互不影响。
+"""
+
+from types import SimpleNamespace
+
+from llm_news.collectors.reddit_collector import RedditCollector
+
+
+class _FakeSubreddit:
+    def __init__(self, name: str, requests: list[tuple[str, int]]):
+        self.name = name
+        self.requests = requests
+
+    def top(self, time_filter: str, limit: int):
+        self.requests.append((self.name, limit))
+        if self.name == "private":
+            raise RuntimeError("403 Forbidden")
+        return [
+            SimpleNamespace(
+                title=f"LLM post {i}", selftext="", url="",
+                permalink=f"/r/{self.name}/comments/{i}", created_utc=1700000000,
+                score=1, subreddit=SimpleNamespace(display_name=self.name),
+            )
+            for i in range(limit)
+        ]
+
+
+def _collector(subreddits: list[str], requests: list[tuple[str, int]]) -> RedditCollector:
+    collector = RedditCollector(
+        subreddits=subreddits, client_id="id", client_secret="secret", limit=3,
+    )
+    reddit = SimpleNamespace(subreddit=lambda name: _FakeSubreddit(name, requests))
+    collector._new_reddit = lambda: reddit
+    return collector
+
+
+class TestRedditCollector:
+    """Reddit collector 测试"""
+
+    def test_each_subreddit_gets_its_own_limit(self):
+        """每个子版块独立请求 limit 条，按配置顺序合并"""
+        requests: list[tuple[str, int]] = []
+        items = _collector(["MachineLearning", "LocalLLaMA"], requests).collect(["llm"])
+        assert sorted(requests) == [("LocalLLaMA", 3), ("MachineLearning", 3)]
+        assert [it.source_name for it in items] == ["r/MachineLearning"] * 3 + ["r/LocalLLaMA"] * 3
+
+    def test_failing_subreddit_isolated(self):
+        """单个子版块失败不影响其他子版块"""
+        requests: list[tuple[str, int]] = []
+        items = _collector(["private", "LocalLLaMA"], requests).collect(["llm"])
+        assert [it.source_name for it in items] == ["r/LocalLLaMA"] * 3
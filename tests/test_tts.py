@@ -0,0 +1,42 @@
+"""Tests for Edge TTS audio generation.
+
+测试分段并发合成：按顺序拼接、清理临时分段文件。
+"""
+
+from pathlib import Path
+
+from llm_news import tts
+
+
+class _FakeCommunicate:
+    """以文本内容作为 "音频" 写出，避免访问网络"""
+
+    def __init__(self, text: str, voice: str, rate: str):
+        self.text = text
+
+    def _write(self, path: str) -> None:
+        Path(path).write_bytes(self.text.encode("utf-8"))
+
+    async def save(self, path: str) -> None:
+        self._write(path)
+
+
+class TestGenerateAudio:
+    """音频生成测试"""
+
+    def test_split_segments(self):
+        """按空行切分段落并去除空段"""
+        assert tts._split_segments("A\n\nB\n  \nC\n\n\n") == ["A", "B", "C"]
+
+    def test_segments_concatenated_in_order(self, tmp_path, monkeypatch):
+        """多段并发合成后按原顺序拼接，分段文件被清理"""
+        monkeypatch.setattr(tts.edge_tts, "Communicate", _FakeCommunicate)
+        out = tts.generate_audio("one\n\ntwo\n\nthree", tmp_path / "a.mp3")
+        assert out.read_bytes() == b"onetwothree"
+        assert [p.name for p in tmp_path.iterdir()] == ["a.mp3"]
+
+    def test_single_segment(self, tmp_path, monkeypatch):
+        """单段落直接写出"""
+        monkeypatch.setattr(tts.edge_tts, "Communicate", _FakeCommunicate)
+        out = tts.generate_audio("hello", tmp_path / "a.mp3")
+        assert out.read_bytes() == b"hello"